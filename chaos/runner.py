@@ -3,6 +3,7 @@ Ejecutor de experimentos de Chaos Engineering.
 Orquesta y coordina la ejecución de múltiples experimentos.
 """
 
+import heapq
 import time
 import threading
 from typing import Dict, List, Optional, Callable
@@ -438,20 +439,40 @@ class ExperimentRunner:
         """
         Inicia un lote de experimentos con retraso entre cada uno.
         """
-        def start_batch():
-            for i, exp_id in enumerate(experiment_ids):
-                if i > 0:
-                    time.sleep(stagger_seconds)
-                
+        schedule = {exp_id: i * stagger_seconds for i, exp_id in enumerate(experiment_ids)}
+        self.schedule_experiments(schedule)
+        
+        logger.info(f"Iniciando lote de {len(experiment_ids)} experimentos con retraso de {stagger_seconds}s")
+        return True
+    
+    def schedule_experiments(self, delays: Dict[str, float]) -> threading.Thread:
+        """
+        Programa experimentos con retrasos arbitrarios (segundos desde ahora).
+        
+        Un único hilo recorre un min-heap de (deadline, exp_id) y duerme hasta el
+        siguiente vencimiento, en lugar de lanzar un hilo dormido por experimento.
+        Los plazos son absolutos, así que la duración de start_experiment no
+        desplaza a los experimentos siguientes.
+        """
+        start = time.monotonic()
+        schedule = [(start + delay, order, exp_id)
+                    for order, (exp_id, delay) in enumerate(delays.items())]
+        heapq.heapify(schedule)
+        
+        def run_schedule():
+            while schedule:
+                deadline, _, exp_id = heapq.heappop(schedule)
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+
                 success = self.start_experiment(exp_id)
                 if not success:
                     logger.error(f"Error iniciando experimento {exp_id} en lote")
         
-        batch_thread = threading.Thread(target=start_batch, daemon=True)
-        batch_thread.start()
-        
-        logger.info(f"Iniciando lote de {len(experiment_ids)} experimentos con retraso de {stagger_seconds}s")
-        return True
+        schedule_thread = threading.Thread(target=run_schedule, daemon=True)
+        schedule_thread.start()
+        return schedule_thread
     
     def emergency_stop(self):
         """Parada de emergencia - detiene todos los experimentos inmediatamente"""
@@ -117,7 +117,7 @@ class LoadBalancer:
                     service.request_count += 1
                     service.error_count += 1
             
-            logger.error(f"Error en routing hacia {service_name}: {e}")
+            logger.error("Error en routing hacia %s: %s", service_name, e)
             raise
     
     def _select_instance(self, service: Service) -> Optional[ServiceInstance]:
@@ -157,8 +157,9 @@ class LoadBalancer:
             selected = instances[counter % len(instances)]
             self._round_robin_counters[service.name] = (counter + 1) % len(instances)
             
-            logger.debug(f"Round-robin: seleccionada instancia {selected.instance_id} "
-                        f"({counter % len(instances) + 1}/{len(instances)}) para {service.name}")
+            logger.debug("Round-robin: seleccionada instancia %s (%d/%d) para %s",
+                         selected.instance_id, counter % len(instances) + 1,
+                         len(instances), service.name)
             
             return selected
     
@@ -42,7 +42,7 @@ class MetricCollector:
     def __init__(self, max_points: int = 1000):
         self.max_points = max_points
         self.metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_points))
-        self.lock = threading.RLock()
+        self.lock = threading.Lock()  # Ningún método reentra en el lock
     
     def add_metric(self, metric_name: str, value: float, tags: Dict[str, str] = None):
         """Añade un punto de métrica"""
@@ -255,6 +255,8 @@ class MonitoringSystem:
             "service_metrics": {},
             "alerts": []
         }
+        # El dashboard se reconstruye solo cuando alguien lo consulta
+        self._dashboard_stale = False
         
         logger.info("Sistema de monitoreo inicializado")
     
@@ -287,7 +289,9 @@ class MonitoringSystem:
         while self.is_running:
             try:
                 self._collect_all_metrics()
-                self._update_dashboard_data()
+                # Marcar el dashboard como desactualizado en lugar de reconstruirlo
+                # en cada ciclo: solo se genera cuando se llama a get_dashboard_data
+                self._dashboard_stale = True
                 time.sleep(self.collection_interval)
             except Exception as e:
                 logger.error(f"Error en loop de monitoreo: {e}")
@@ -399,21 +403,25 @@ class MonitoringSystem:
     def _update_dashboard_data(self):
         """Actualiza los datos del dashboard"""
         with self.lock:
+            active_alerts = self.alert_manager.get_active_alerts()
             self.dashboard_data = {
                 "last_update": time.time(),
-                "system_overview": self._generate_system_overview(),
+                "system_overview": self._generate_system_overview(active_alerts),
                 "service_metrics": self._generate_service_metrics(),
-                "alerts": [asdict(alert) for alert in self.alert_manager.get_active_alerts()]
+                "alerts": [asdict(alert) for alert in active_alerts]
             }
+            self._dashboard_stale = False
     
-    def _generate_system_overview(self) -> Dict:
+    def _generate_system_overview(self, active_alerts: List[Alert] = None) -> Dict:
         """Genera un overview del sistema"""
+        if active_alerts is None:
+            active_alerts = self.alert_manager.get_active_alerts()
+        
         overview = {
             "total_services": len([name for name in self.monitored_components.keys() 
                                  if hasattr(self.monitored_components[name], 'get_service_metrics')]),
-            "total_alerts": len(self.alert_manager.get_active_alerts()),
-            "critical_alerts": len([a for a in self.alert_manager.get_active_alerts() 
-                                  if a.severity == "CRITICAL"]),
+            "total_alerts": len(active_alerts),
+            "critical_alerts": len([a for a in active_alerts if a.severity == "CRITICAL"]),
             "system_health": "HEALTHY"
         }
         
@@ -453,6 +461,8 @@ class MonitoringSystem:
     def get_dashboard_data(self) -> Dict:
         """Retorna los datos actuales del dashboard"""
         with self.lock:
+            if self._dashboard_stale:
+                self._update_dashboard_data()
             return self.dashboard_data.copy()
     
     def get_metric_history(self, metric_name: str, time_window_seconds: int = 300) -> List[Dict]:
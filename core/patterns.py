@@ -288,6 +288,7 @@ class RetryPolicy:
         Ejecuta una función con política de retry.
         """
         last_exception = None
+        backoff = self.base_delay  # Crece multiplicando en cada fallo, sin recalcular potencias
         
         for attempt in range(self.max_attempts):
             self.total_attempts += 1
@@ -305,7 +306,8 @@ class RetryPolicy:
                 last_exception = e
                 
                 if attempt < self.max_attempts - 1:
-                    delay = self._calculate_delay(attempt)
+                    delay = self._calculate_delay(backoff)
+                    backoff *= self.backoff_factor
                     logger.warning(f"Intento {attempt + 1} falló: {e}. Reintentando en {delay:.2f}s")
                     time.sleep(delay)
                 else:
@@ -314,10 +316,9 @@ class RetryPolicy:
         
         raise last_exception
     
-    def _calculate_delay(self, attempt: int) -> float:
-        """Calcula el delay para el siguiente intento"""
-        delay = self.base_delay * (self.backoff_factor ** attempt)
-        delay = min(delay, self.max_delay)
+    def _calculate_delay(self, backoff: float) -> float:
+        """Calcula el delay para el siguiente intento a partir del backoff acumulado"""
+        delay = min(backoff, self.max_delay)
         
         if self.jitter:
             # Añadir jitter para evitar thundering herd
@@ -49,12 +49,21 @@ class ServiceInstance:
     Cada instancia puede tener su propio estado y métricas.
     """
     
+    # Sin __dict__ por instancia: menos memoria y acceso a atributos más rápido
+    __slots__ = (
+        "service_name", "instance_id", "port", "region", "_status_listener", "_status",
+        "metrics", "start_time", "last_request_time", "failure_count", "recovery_time",
+        "base_response_time", "error_probability", "lock", "is_processing",
+        "active_requests", "_active_lock",
+    )
+    
     def __init__(self, service_name: str, instance_id: str = None, 
                  port: int = None, region: str = "us-east-1"):
         self.service_name = service_name
         self.instance_id = instance_id or str(uuid.uuid4())[:8]
         self.port = port or random.randint(8000, 9000)
         self.region = region
+        self._status_listener = None  # Callback del Service propietario ante cambios de estado
         self.status = ServiceStatus.HEALTHY
         self.metrics = ServiceMetrics()
         self.start_time = time.time()
@@ -66,17 +75,34 @@ class ServiceInstance:
         self.base_response_time = random.uniform(50, 200)  # ms
         self.error_probability = 0.005  # Reducido de 0.01 a 0.005 (0.5% en lugar de 1%)
         
-        # Threading para simular carga
-        self.lock = threading.RLock()
+        # Threading para simular carga (Lock simple: handle_request no reentra)
+        self.lock = threading.Lock()
         self.is_processing = False
         
-        logger.info(f"Instancia {self.instance_id} del servicio {self.service_name} iniciada en puerto {self.port}")
+        # Requests en curso (incluye las que esperan el lock), usado por Service para elegir instancia
+        self.active_requests = 0
+        self._active_lock = threading.Lock()
+        
+        logger.info("Instancia %s del servicio %s iniciada en puerto %s", self.instance_id, self.service_name, self.port)
     
     def handle_request(self, request_data: Dict = None) -> Dict:
         """
         Simula el procesamiento de una request.
         Retorna la respuesta con métricas actualizadas.
+        
+        Lleva la cuenta de requests en curso (active_requests, incluidas las que
+        esperan el lock) para cualquier llamador: Service y LoadBalancer.
         """
+        with self._active_lock:
+            self.active_requests += 1
+        try:
+            return self._process_request(request_data)
+        finally:
+            with self._active_lock:
+                self.active_requests -= 1
+    
+    def _process_request(self, request_data: Dict = None) -> Dict:
+        """Procesa la request bajo el lock de la instancia"""
         with self.lock:
             start_time = time.time()
             self.last_request_time = start_time
@@ -180,15 +206,27 @@ class ServiceInstance:
             # Auto-recuperación más conservadora
             if self.status == ServiceStatus.DEGRADED and random.random() < 0.4:  # Aumentado de 0.2 a 0.4
                 self.set_status(ServiceStatus.HEALTHY)
-                logger.info(f"Instancia {self.instance_id} se ha recuperado automáticamente")
+                logger.info("Instancia %s se ha recuperado automáticamente", self.instance_id)
             
             self.metrics.last_health_check = time.time()
             return self.status == ServiceStatus.HEALTHY
             
         except Exception as e:
-            logger.error(f"Error en health check de {self.instance_id}: {e}")
+            logger.error("Error en health check de %s: %s", self.instance_id, e)
             return False
     
+    @property
+    def status(self) -> ServiceStatus:
+        """Estado actual de la instancia"""
+        return self._status
+    
+    @status.setter
+    def status(self, status: ServiceStatus):
+        # Toda asignación (incluidas las directas) se notifica al Service propietario
+        self._status = status
+        if self._status_listener is not None:
+            self._status_listener(self)
+    
     def set_status(self, status: ServiceStatus):
         """Cambia el estado de la instancia"""
         old_status = self.status
@@ -243,7 +281,8 @@ class Service:
     
     def __init__(self, name: str, service_type: ServiceType, 
                  initial_instances: int = 4, min_instances: int = 2,  # Aumentado de 3,1 a 4,2
-                 max_instances: int = 10, region: str = "us-east-1"):  # Aumentado para permitir más escalado
+                 max_instances: int = 10, region: str = "us-east-1",  # Aumentado para permitir más escalado
+                 start_health_checks: bool = True):
         """
         Inicializa un servicio distribuido con más instancias por defecto.
         
@@ -256,6 +295,8 @@ class Service:
         self.service_type = service_type
         self.region = region  # Agregado atributo region
         self.instances: Dict[str, ServiceInstance] = {}
+        # Instancias HEALTHY, mantenidas en cada cambio de estado (evita recorrer todas)
+        self._healthy_instances: Dict[str, ServiceInstance] = {}
         self.initial_instances = initial_instances
         self.min_instances = min_instances
         self.max_instances = max_instances
@@ -269,14 +310,17 @@ class Service:
         # Threading
         self.lock = threading.RLock()
         self.health_check_thread = None
+        self._stop_health_checks = threading.Event()
         self.auto_scaling_enabled = True  # Agregado atributo faltante
         
         # Crear instancias iniciales
         for i in range(initial_instances):
             self.add_instance()
         
-        # Iniciar health checks
-        self._start_health_checks()
+        # Iniciar health checks (desactivables para tests deterministas: el
+        # primer ciclo de auto-scaling corre en cuanto arranca el hilo)
+        if start_health_checks:
+            self._start_health_checks()
         
         logger.info(f"Servicio {name} ({service_type.value}) iniciado con {initial_instances} instancias")
     
@@ -290,7 +334,9 @@ class Service:
                 region=self.region
             )
             self.instances[instance.instance_id] = instance
-            logger.info(f"Instancia {instance.instance_id} añadida al servicio {self.name}")
+            instance._status_listener = self._on_instance_status_change
+            self._on_instance_status_change(instance)
+            logger.info("Instancia %s añadida al servicio %s", instance.instance_id, self.name)
             return instance
     
     def remove_instance(self, instance_id: str) -> bool:
@@ -299,18 +345,24 @@ class Service:
             if instance_id in self.instances:
                 instance = self.instances[instance_id]
                 instance.terminate()
+                instance._status_listener = None
                 del self.instances[instance_id]
-                logger.info(f"Instancia {instance_id} removida del servicio {self.name}")
+                logger.info("Instancia %s removida del servicio %s", instance_id, self.name)
                 return True
             return False
     
+    def _on_instance_status_change(self, instance: ServiceInstance):
+        """Actualiza el índice de instancias saludables tras un cambio de estado"""
+        if instance.status == ServiceStatus.HEALTHY and instance.instance_id in self.instances:
+            self._healthy_instances[instance.instance_id] = instance
+        else:
+            self._healthy_instances.pop(instance.instance_id, None)
+    
     def get_healthy_instances(self) -> List[ServiceInstance]:
         """Devuelve solo instancias realmente *saludables* (estado HEALTHY)."""
         # Anteriormente se incluían instancias DEGRADED, lo que inflaba la
         # disponibilidad al 100 % aun cuando había problemas.
-        return [
-            inst for inst in self.instances.values() if inst.status == ServiceStatus.HEALTHY
-        ]
+        return list(self._healthy_instances.values())
     
     def get_available_instances(self) -> List[ServiceInstance]:
         """Devuelve instancias que pueden recibir tráfico (HEALTHY + DEGRADED)."""
@@ -335,8 +387,8 @@ class Service:
             self.request_count += 1  # Contar también requests fallidos
             raise ServiceException(f"No hay instancias saludables en el servicio {self.name}")
         
-        # Balanceo de carga round-robin simple
-        instance = random.choice(available_instances)
+        # Balanceo de carga "power of two choices"
+        instance = self._select_instance(available_instances)
         
         try:
             start_time = time.time()
@@ -354,20 +406,70 @@ class Service:
             # Mejorar tracking de errores
             self.error_count += 1
             self.request_count += 1  # Contar también requests fallidos
-            logger.error(f"Error en servicio {self.name}: {e}")
+            logger.error("Error en servicio %s: %s", self.name, e)
             raise
+
+    def handle_requests(self, count: int, request_data: Dict = None) -> List[Dict]:
+        """
+        Maneja `count` requests en lote (versión por lotes de handle_request).
+        Calcula las instancias disponibles una sola vez y actualiza los
+        contadores del servicio al final bajo un único lock. Las requests
+        fallidas se contabilizan como errores en lugar de propagar la excepción.
+        """
+        available_instances = self.get_available_instances()
+        
+        if not available_instances:
+            with self.lock:
+                self.error_count += count
+                self.request_count += count
+            raise ServiceException(f"No hay instancias saludables en el servicio {self.name}")
+        
+        responses = []
+        errors = 0
+        total_response_time = 0.0
+        
+        for _ in range(count):
+            instance = self._select_instance(available_instances)
+            try:
+                start_time = time.time()
+                responses.append(instance.handle_request(request_data))
+                total_response_time += (time.time() - start_time) * 1000
+            except ServiceException as e:
+                errors += 1
+                logger.debug("Error en servicio %s: %s", self.name, e)
+        
+        with self.lock:
+            self.request_count += count
+            self.successful_requests += len(responses)
+            self.error_count += errors
+            self.total_response_time += total_response_time
+        
+        return responses
+    
+    @staticmethod
+    def _select_instance(instances: List[ServiceInstance]) -> ServiceInstance:
+        """
+        Elige instancia con "power of two choices": toma dos al azar y se queda
+        con la que tiene menos requests en curso. Evita los hotspots de la
+        elección puramente aleatoria sin recorrer todas las instancias.
+        """
+        if len(instances) < 2:
+            return instances[0]
+        
+        first, second = random.sample(instances, 2)
+        return first if first.active_requests <= second.active_requests else second
     
     def _start_health_checks(self):
         """Inicia el hilo de health checks automáticos"""
         def health_check_loop():
-            while True:
+            while not self._stop_health_checks.is_set():
                 try:
                     self._perform_health_checks()
                     self._auto_scale_if_needed()
-                    time.sleep(10)  # Health check cada 10 segundos
+                    self._stop_health_checks.wait(10)  # Health check cada 10 segundos
                 except Exception as e:
                     logger.error(f"Error en health check de {self.name}: {e}")
-                    time.sleep(5)
+                    self._stop_health_checks.wait(5)
         
         self.health_check_thread = threading.Thread(target=health_check_loop, daemon=True)
         self.health_check_thread.start()
@@ -448,8 +550,6 @@ class Service:
         - Métricas más detalladas por instancia
         """
         with self.lock:
-            healthy_instances = self.get_healthy_instances()
-            
             if not self.instances:
                 return {
                     "service_name": self.name,
@@ -463,9 +563,37 @@ class Service:
                     "successful_requests": 0
                 }
             
+            # Una sola pasada sobre las instancias: conteo de saludables,
+            # tiempos de respuesta y detalle por instancia
+            healthy_count = 0
+            response_time_sum = 0.0
+            response_time_count = 0
+            instances_detail = {}
+            
+            for instance_id, instance in self.instances.items():
+                metrics = instance.metrics
+                if instance.status == ServiceStatus.HEALTHY:
+                    healthy_count += 1
+                if metrics.response_time_ms > 0:
+                    response_time_sum += metrics.response_time_ms
+                    response_time_count += 1
+                
+                instances_detail[instance_id] = {
+                    "status": instance.status.value,
+                    "failure_count": instance.failure_count,
+                    "region": instance.region,
+                    "port": instance.port,
+                    "metrics": {
+                        "response_time_ms": round(metrics.response_time_ms, 2),
+                        "cpu_usage": round(metrics.cpu_usage, 1),
+                        "memory_usage": round(metrics.memory_usage, 1),
+                        "uptime_seconds": round(metrics.uptime_seconds, 1),
+                        "error_probability": round(instance.error_probability * 100, 2)  # Como porcentaje
+                    }
+                }
+            
             # Cálculos mejorados de métricas agregadas
             total_instances = len(self.instances)
-            healthy_count = len(healthy_instances)
             availability = (healthy_count / total_instances) * 100 if total_instances > 0 else 0
             
             # Promedio de tiempo de respuesta más preciso
@@ -473,9 +601,7 @@ class Service:
                 avg_response_time = self.total_response_time / self.successful_requests
             else:
                 # Si no hay requests exitosos, usar promedio de instancias
-                instance_times = [inst.metrics.response_time_ms for inst in self.instances.values() 
-                                if inst.metrics.response_time_ms > 0]
-                avg_response_time = sum(instance_times) / len(instance_times) if instance_times else 0
+                avg_response_time = response_time_sum / response_time_count if response_time_count else 0
             
             # Tasa de error más precisa
             error_rate = (self.error_count / max(1, self.request_count)) * 100
@@ -491,22 +617,7 @@ class Service:
                 "successful_requests": self.successful_requests,
                 "error_count": self.error_count,
                 "error_rate": round(error_rate, 3),  # Redondear con más precisión
-                "instances": {
-                    instance_id: {
-                        "status": instance.status.value,
-                        "failure_count": instance.failure_count,
-                        "region": instance.region,
-                        "port": instance.port,
-                        "metrics": {
-                            "response_time_ms": round(instance.metrics.response_time_ms, 2),
-                            "cpu_usage": round(instance.metrics.cpu_usage, 1),
-                            "memory_usage": round(instance.metrics.memory_usage, 1),
-                            "uptime_seconds": round(instance.metrics.uptime_seconds, 1),
-                            "error_probability": round(instance.error_probability * 100, 2)  # Como porcentaje
-                        }
-                    }
-                    for instance_id, instance in self.instances.items()
-                }
+                "instances": instances_detail
             }
     
     def chaos_terminate_random_instance(self) -> Optional[str]:
@@ -527,6 +638,30 @@ class Service:
         logger.warning(f"CHAOS: Instancia {target_instance.instance_id} del servicio {self.name} terminada")
         return target_instance.instance_id
     
+    def chaos_terminate_random_instances(self, count: int) -> List[str]:
+        """
+        Termina hasta `count` instancias aleatorias en una sola sección crítica
+        (versión por lotes de chaos_terminate_random_instance).
+        Respeta el número mínimo de instancias saludables.
+        """
+        with self.lock:
+            healthy_instances = self.get_healthy_instances()
+            allowed = min(count, len(healthy_instances) - self.min_instances)
+            
+            if allowed <= 0:
+                logger.warning(f"No se puede terminar instancias en {self.name}: "
+                             f"mínimo de instancias saludables alcanzado")
+                return []
+            
+            targets = random.sample(healthy_instances, allowed)
+            for instance in targets:
+                instance.terminate()
+            
+            terminated_ids = [instance.instance_id for instance in targets]
+            logger.warning(f"CHAOS: {len(terminated_ids)} instancias del servicio {self.name} terminadas: "
+                         f"{', '.join(terminated_ids)}")
+            return terminated_ids
+    
     def chaos_introduce_latency(self, latency_ms: float, instance_id: str = None):
         """Introduce latencia en una o todas las instancias"""
         targets = [self.instances[instance_id]] if instance_id else list(self.instances.values())
@@ -542,11 +677,15 @@ class Service:
             instance.introduce_errors(error_rate)
     
     def shutdown(self):
-        """Cierra el servicio y todas sus instancias"""
+        """Cierra el servicio y todas sus instancias, y detiene el hilo de health checks"""
+        self._stop_health_checks.set()
         with self.lock:
             for instance in self.instances.values():
                 instance.terminate()
             logger.info(f"Servicio {self.name} cerrado")
+        
+        if self.health_check_thread is not None and self.health_check_thread is not threading.current_thread():
+            self.health_check_thread.join(timeout=1)
 
 class ServiceException(Exception):
     """Excepción personalizada para errores de servicio"""
@@ -11,24 +11,619 @@ EJECUTAR:
 ¡Eso es todo! 🎉
 """
 
+import io
 import os
+import queue
 import random
 import sys
-import time
 import threading
-from typing import Dict, Any
+import time
+from typing import Dict, Any, List, Optional
 import logging
+from types import MappingProxyType
+from collections import deque
+
+# termios solo existe en POSIX; en Windows el vaciado de stdin es un no-op
+try:
+    import termios
+    TERMIOS_AVAILABLE = True
+except ImportError:
+    TERMIOS_AVAILABLE = False
+
+# readline es opcional (no existe en Windows sin pyreadline3)
+try:
+    import readline
+    READLINE_AVAILABLE = True
+except ImportError:
+    READLINE_AVAILABLE = False
+
+# Configurar el path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# ChaosEngineeringSystem se importa de forma diferida en create_stable_demo_system
+# para no cargar todo el grafo de core/chaos/reports al importar este módulo.
+from utils.helpers import setup_colored_logging
+
+logger = logging.getLogger(__name__)
+
+# Secuencia ANSI equivalente a `clear`: cursor al inicio, borrar pantalla y scrollback
+_CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+# Respuestas afirmativas aceptadas por confirm()
+_YES_ANSWERS = frozenset({'s', 'si', 'sí', 'y', 'yes'})
+
+# Periodo (s) de refresco del monitoreo visual: se duplica mientras las
+# métricas no cambian, hasta el máximo, y vuelve al mínimo ante cualquier cambio
+_MONITOR_INTERVAL = 3.0
+_MONITOR_MAX_INTERVAL = 24.0
+
+# A partir de cuántos servicios se elige por nombre con autocompletado en lugar de lista
+_COMPLETION_THRESHOLD = 20
+
+# Muestras de duración por fase que se conservan durante el monitoreo visual
+_POLL_STATS_SAMPLES = 256
+
+# Textos fijos de los menús (se construyen una sola vez al importar el módulo)
+_WELCOME_BANNER = """
+╔═══════════════════════════════════════════════════════════════╗
+║                                                               ║
+║    🔥 DEMO INTERACTIVO DE CHAOS ENGINEERING 🔥               ║
+║                                                               ║
+║    ┌─────────────────────────────────────────────────────┐   ║
+║    │  🏗️  Arquitectura Distribuida Simulada             │   ║
+║    │  🐒  Chaos Monkey Inteligente                       │   ║
+║    │  📊  Métricas en Tiempo Real                        │   ║
+║    │  🧪  Experimentos Interactivos                      │   ║
+║    │  📈  Reportes HTML Automáticos                      │   ║
+║    └─────────────────────────────────────────────────────┘   ║
+║                                                               ║
+║    🎯 Aprende Chaos Engineering de forma visual e interactiva ║
+║                                                               ║
+╚═══════════════════════════════════════════════════════════════╝
+        """
+
+_MAIN_MENU_HEADER = """
+┌─────────────────── DEMO INTERACTIVO ───────────────────┐
+│                                                        │
+"""
+
+_MAIN_MENU_OPTIONS = """
+│                                                        │
+│  🚀 1. Demo Rápida (5 min) - ¡RECOMENDADO!            │
+│  🧪 2. Experimentos Interactivos                      │
+│  📊 3. Monitoreo Visual en Tiempo Real                │
+│  💥 4. Escenarios de Caos Avanzados                   │
+│  🔍 5. Estado del Sistema                             │
+│  📚 6. Modo Educativo                                 │
+│                                                       │
+│  🚪 0. Salir                                          │
+│                                                       │
+└───────────────────────────────────────────────────────┘
+        """
+
+# Textos del modo educativo
+_TEXT_CHAOS_ENGINEERING = """
+❓ ¿QUÉ ES CHAOS ENGINEERING?
+═══════════════════════════════════
+
+Chaos Engineering es una disciplina que consiste en experimentar con 
+sistemas distribuidos para descubrir debilidades antes de que se 
+manifiesten como comportamientos aberrantes en producción.
+
+🎯 OBJETIVOS PRINCIPALES:
+   • Encontrar puntos únicos de falla
+   • Probar la efectividad de mecanismos de fallback
+   • Mejorar la resiliencia del sistema
+   • Generar confianza en la infraestructura
+
+📈 HISTORIA:
+   • 2010: Netflix introduce "Chaos Monkey"
+   • 2012: Evolución hacia "Simian Army"
+   • 2017: Principios de Chaos Engineering publicados
+   • Hoy: Adoptado por Amazon, Google, Facebook, Microsoft
+
+🔬 METODOLOGÍA:
+   1. Definir el "estado estable" del sistema
+   2. Hipotetizar que el estado se mantendrá
+   3. Introducir variables del mundo real (fallas)
+   4. Intentar refutar la hipótesis
+
+💡 BENEFICIOS:
+   • Reducción de incidentes en producción
+   • Mejor comprensión del sistema
+   • Identificación proactiva de problemas
+   • Incremento en la confianza del equipo
+        """
+
+_TEXT_DISTRIBUTED_SYSTEMS = """
+🏗️ ARQUITECTURAS DISTRIBUIDAS
+════════════════════════════════
+
+Los sistemas distribuidos son colecciones de computadoras independientes
+que aparecen ante los usuarios como un sistema único y coherente.
+
+🔧 COMPONENTES PRINCIPALES:
+
+   🌐 API Gateway:
+      • Punto de entrada único
+      • Enrutamiento de requests
+      • Autenticación y autorización
+      • Rate limiting
+
+   🔐 Servicios de Autenticación:
+      • Gestión de identidades
+      • Tokens y sesiones
+      • Control de acceso
+
+   👥 Microservicios:
+      • Servicios independientes
+      • Responsabilidad única
+      • Comunicación via APIs
+
+   💾 Capa de Datos:
+      • Bases de datos distribuidas
+      • Cache distribuido
+      • Consistencia eventual
+
+   ⚖️ Balanceadores de Carga:
+      • Distribución de tráfico
+      • Health checks
+      • Failover automático
+
+⚠️ DESAFÍOS:
+   • Latencia de red
+   • Fallas parciales
+   • Consistencia de datos
+   • Complejidad operacional
+
+🎯 BENEFICIOS:
+   • Escalabilidad
+   • Resiliencia
+   • Flexibilidad tecnológica
+   • Independencia de equipos
+        """
+
+_TEXT_EXPERIMENT_TYPES = """
+🧪 TIPOS DE EXPERIMENTOS DE CHAOS
+══════════════════════════════════════
+
+🐒 CHAOS MONKEY (Básico):
+   • Terminación aleatoria de instancias
+   • Primer nivel de chaos engineering
+   • Prueba redundancia y failover
+
+🌐 EXPERIMENTOS DE RED:
+   • Latency Monkey: Delays artificiales
+   • Network Partition: Aislamiento de servicios
+   • Packet Loss: Pérdida de paquetes
+
+💾 AGOTAMIENTO DE RECURSOS:
+   • CPU Exhaustion: Consumo al 100%
+   • Memory Exhaustion: Agotamiento de RAM
+   • Disk I/O: Saturación de disco
+
+🦍 CHAOS GORILLA (Destructivo):
+   • Falla de zona completa
+   • Afecta múltiples servicios
+   • Prueba recuperación regional
+
+🧨 CHAOS KONG (Muy Destructivo):
+   • Falla de región completa
+   • Máximo nivel de destrucción
+   • Solo en entornos seguros
+
+🩺 EXPERIMENTOS DE DIAGNÓSTICO:
+   • Doctor Monkey: Health checks
+   • Performance Monitor: Análisis de rendimiento
+   • Security Monkey: Vulnerabilidades
+
+📊 NIVELES DE RIESGO:
+   🟢 Bajo: Chaos Monkey, Latency
+   🟡 Medio: Resource Exhaustion, Network Partition
+   🔴 Alto: Chaos Gorilla, Database Failures
+   ⚫ Crítico: Chaos Kong, Regional Failures
+
+💡 MEJORES PRÁCTICAS:
+   • Comenzar con experimentos simples
+   • Incrementar complejidad gradualmente
+   • Tener plan de rollback
+   • Monitorear métricas clave
+        """
+
+_TEXT_METRICS = """
+📊 MÉTRICAS Y MONITOREO
+═══════════════════════════
+
+📈 MÉTRICAS FUNDAMENTALES:
+
+   ⏱️ LATENCIA:
+      • Tiempo de respuesta promedio
+      • Percentiles P50, P95, P99
+      • Timeout rates
+
+   🚀 THROUGHPUT:
+      • Requests por segundo (RPS)
+      • Transacciones por minuto
+      • Bandwidth utilizado
+
+   ❌ ERROR RATE:
+      • Porcentaje de errores
+      • Códigos de estado HTTP
+      • Timeouts y fallos
+
+   📊 DISPONIBILIDAD:
+      • Uptime percentage
+      • SLA compliance
+      • MTTR (Mean Time To Recovery)
+      • MTBF (Mean Time Between Failures)
+
+🎯 GOLDEN SIGNALS:
+   1. Latency - ¿Qué tan rápido?
+   2. Traffic - ¿Cuánto tráfico?
+   3. Errors - ¿Qué está fallando?
+   4. Saturation - ¿Qué tan lleno?
+
+📱 TIPOS DE ALERTAS:
+
+   🔴 CRÍTICAS:
+      • Sistema completamente caído
+      • Pérdida de datos
+      • Seguridad comprometida
+
+   🟠 ALTAS:
+      • SLA en riesgo
+      • Degradación significativa
+      • Recursos agotándose
+
+   🟡 MEDIAS:
+      • Tendencias preocupantes
+      • Umbrales preventivos
+      • Anomalías detectadas
+
+🛠️ HERRAMIENTAS COMUNES:
+   • Prometheus + Grafana
+   • DataDog
+   • New Relic
+   • CloudWatch
+
+💡 MEJORES PRÁCTICAS:
+   • Definir SLOs claros
+   • Alertas accionables
+   • Dashboards por audiencia
+   • Retención de datos históricos
+        """
+
+_TEXT_RESILIENCE_PATTERNS = """
+🔄 PATRONES DE RESILIENCIA
+═══════════════════════════════
+
+🛡️ CIRCUIT BREAKER:
+   • Previene cascadas de fallas
+   • Estados: Closed, Open, Half-Open
+   • Failfast cuando hay problemas
+   • Recuperación automática
+
+🏰 BULKHEAD:
+   • Aislamiento de recursos
+   • Compartimentos separados
+   • Falla aislada no afecta todo
+   • Pool de conexiones segregado
+
+🔄 RETRY CON BACKOFF:
+   • Reintentos inteligentes
+   • Backoff exponencial
+   • Jitter para evitar thundering herd
+   • Máximo número de intentos
+
+⏰ TIMEOUT:
+   • Límites de tiempo de espera
+   • Evita recursos bloqueados
+   • Configuración por operación
+   • Cascading timeouts
+
+🎭 FALLBACK:
+   • Respuestas de emergencia
+   • Graceful degradation
+   • Cache como fallback
+   • Respuestas por defecto
+
+⚖️ RATE LIMITING:
+   • Control de tráfico
+   • Previene sobrecarga
+   • Token bucket algorithm
+   • Sliding window
+
+🔀 LOAD BALANCING:
+   • Distribución de carga
+   • Health checks
+   • Algoritmos: Round Robin, Least Connections
+   • Sticky sessions
+
+📦 CACHING:
+   • Reducción de latencia
+   • Offload de servicios backend
+   • Cache invalidation strategies
+   • Multi-level caching
+
+💡 IMPLEMENTACIÓN:
+   • Combinar múltiples patrones
+   • Configuración por servicio
+   • Monitoreo de efectividad
+   • Testing de patrones
+        """
+
+_TEXT_BEST_PRACTICES = """
+🎯 MEJORES PRÁCTICAS DE CHAOS ENGINEERING
+═══════════════════════════════════════════
+
+🚀 COMENZANDO:
+
+   📋 1. PREPARACIÓN:
+      • Definir estado estable del sistema
+      • Establecer métricas baseline
+      • Identificar servicios críticos
+      • Crear plan de rollback
+
+   🎯 2. HIPÓTESIS:
+      • Específica y medible
+      • "El sistema mantendrá X disponibilidad cuando..."
+      • Basada en observaciones reales
+      • Validable con métricas
+
+   ⚡ 3. EMPEZAR PEQUEÑO:
+      • Entornos de desarrollo primero
+      • Experimentos simples (Chaos Monkey)
+      • Incrementar gradualmente
+      • Horarios de oficina inicialmente
+
+🔧 EJECUCIÓN:
+
+   📊 4. MONITOREO CONTINUO:
+      • Métricas en tiempo real
+      • Alertas configuradas
+      • Dashboards visibles
+      • Logs centralizados
 
-# Configurar el path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+   🛡️ 5. SAFETY FIRST:
+      • Kill switches disponibles
+      • Blast radius limitado
+      • Dry-run mode disponible
+      • Rollback rápido
 
-from chaos_system import ChaosEngineeringSystem
-from utils.helpers import setup_colored_logging
+   👥 6. COLABORACIÓN:
+      • Involucrar a todos los equipos
+      • Comunicar experimentos
+      • Compartir resultados
+      • Post-mortems sin culpa
+
+📈 ESCALAMIENTO:
+
+   🎮 7. AUTOMATIZACIÓN:
+      • Experimentos programados
+      • Validación automática
+      • Reportes automáticos
+      • Integración CI/CD
+
+   🌍 8. PRODUCCIÓN:
+      • Horarios de bajo tráfico
+      • Monitoreo intensivo
+      • Equipos en standby
+      • Comunicación clara
+
+   📚 9. APRENDIZAJE CONTINUO:
+      • Documentar hallazgos
+      • Mejorar sistemas basado en resultados
+      • Compartir conocimiento
+      • Iterar y mejorar experimentos
+
+❌ QUÉ EVITAR:
+   • Experimentos sin hipótesis
+   • Falta de monitoreo
+   • No tener plan de rollback
+   • Culpar por fallas encontradas
+   • Experimentos en viernes
+        """
+
+# Entradas de los submenús de experimentos y escenarios
+_EXPERIMENT_MENU = (
+    ("1", "🐒 Chaos Monkey", "Terminar instancias aleatoriamente"),
+    ("2", "🌐 Network Latency", "Introducir delays de red"),
+    ("3", "💾 Resource Exhaustion", "Agotar CPU/memoria"),
+    ("4", "🔥 Multiple Chaos", "Varios experimentos simultáneos"),
+    ("5", "🩺 Health Check", "Diagnóstico del sistema"),
+)
+
+# Icono por nivel de riesgo de los escenarios
+_RISK_ICONS = {"MUY DESTRUCTIVO": "🔴", "DESTRUCTIVO": "🔴", "MODERADO": "🟡"}
+
+_SCENARIO_MENU = (
+    ("1", "🦍 Chaos Gorilla", "Falla de zona completa", "DESTRUCTIVO"),
+    ("2", "🔥 Cascade Failure", "Falla en cascada", "MUY DESTRUCTIVO"),
+    ("3", "🌊 Traffic Spike", "Pico masivo de tráfico", "MODERADO"),
+    ("4", "🧨 Database Chaos", "Fallas en base de datos", "DESTRUCTIVO"),
+    ("5", "🔌 Network Partition", "Partición de red", "MODERADO"),
+)
 
 # ═══════════════════════════════════════════════════════════════════
 # CONFIGURACIÓN DE LA DEMO
 # ═══════════════════════════════════════════════════════════════════
 
+def _flush_stdin():
+    """
+    Descarta las teclas pulsadas mientras corría una fase larga de la demo,
+    para que no se consuman como respuesta del siguiente input().
+    """
+    if not TERMIOS_AVAILABLE or not sys.stdin.isatty():
+        return
+    try:
+        termios.tcflush(sys.stdin, termios.TCIFLUSH)
+    except (termios.error, OSError):
+        pass
+
+def _parse_int(raw: str, low: int, high: int) -> Optional[int]:
+    """
+    Convierte la respuesta del usuario a entero dentro de [low, high].
+    Retorna None si no es un número o está fuera de rango (sin lanzar ni
+    capturar ValueError en el caso habitual de una entrada inválida).
+    """
+    raw = raw.strip()
+    if not raw.isdecimal():
+        return None
+    value = int(raw)
+    return value if low <= value <= high else None
+
+def _write_raw(text: str):
+    """
+    Escribe un bloque en stdout como bytes con os.write (una llamada al sistema,
+    sin pasar por el buffer de TextIOWrapper). Fuera de POSIX o si stdout no
+    tiene descriptor real, usa la escritura de texto normal.
+    """
+    try:
+        if os.name != 'posix':
+            raise io.UnsupportedOperation
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    
+    sys.stdout.flush()  # Lo pendiente en el buffer de texto va antes del frame
+    data = memoryview(text.encode(sys.stdout.encoding or "utf-8", errors="replace"))
+    while data:
+        data = data[os.write(fd, data):]
+
+# Niveles de salud por disponibilidad (>90 %, >70 %, resto) y su representación
+_HEALTH_ICONS = ("🔴", "🟡", "🟢")
+_HEALTH_RECOMMENDATIONS = ("CRÍTICO", "Revisar", "OK")
+
+def _health_level(availability: float) -> int:
+    """Índice en las tablas _HEALTH_*: 2 saludable, 1 degradado, 0 crítico"""
+    # Suma de comparaciones (bool es int): dos comparaciones, sin ramas
+    return (availability > 70) + (availability > 90)
+
+def summarize_services(services: Dict[str, Dict]) -> Dict[str, Any]:
+    """
+    Agrega las métricas de todos los servicios en una sola pasada.
+
+    Evita recorrer el diccionario de servicios una vez por cada métrica
+    (total, saludables, disponibilidad) en los bucles de monitoreo.
+    """
+    total_instances = 0
+    healthy_instances = 0
+    availability_sum = 0.0
+    healthy_services = 0
+
+    for service_data in services.values():
+        total_instances += service_data.get('total_instances', 0)
+        healthy_instances += service_data.get('healthy_instances', 0)
+        availability = service_data.get('availability', 0)
+        availability_sum += availability
+        if availability > 90:
+            healthy_services += 1
+
+    return {
+        "total_instances": total_instances,
+        "healthy_instances": healthy_instances,
+        "healthy_services": healthy_services,
+        "avg_availability": availability_sum / len(services) if services else 0
+    }
+
+# Plantilla de servicios de la demo: se define una sola vez a nivel de módulo
+# (solo lectura) y create_stable_demo_system hace una copia superficial por llamada.
+_DEMO_SERVICES_TEMPLATE = MappingProxyType({
+    "api-gateway": {
+        "type": "api-gateway",
+        "initial_instances": 6,  # MUCHAS INSTANCIAS - para estadísticas claras
+        "min_instances": 2,      # AGRESIVO - Solo 2 mínimas
+        "max_instances": 10,
+        "region": "us-east-1"
+    },
+    "auth-service": {
+        "type": "auth-service", 
+        "initial_instances": 5,  # MUCHAS INSTANCIAS - para estadísticas claras
+        "min_instances": 2,      # AGRESIVO - Permitir bajar a 2
+        "max_instances": 8,
+        "region": "us-east-1"
+    },
+    "user-service": {
+        "type": "user-profile",
+        "initial_instances": 5,  # MUCHAS INSTANCIAS - para que fallen algunas
+        "min_instances": 2,      # AGRESIVO - Permitir bajar a 2
+        "max_instances": 8,
+        "region": "us-east-1"
+    },
+    "payment-service": {
+        "type": "database",
+        "initial_instances": 6,  # MUCHAS INSTANCIAS - servicio crítico
+        "min_instances": 2,
+        "max_instances": 9,
+        "region": "us-east-1"
+    },
+    "notification-service": {
+        "type": "api-gateway",
+        "initial_instances": 7,  # MÁS INSTANCIAS - para que muchas fallen
+        "min_instances": 2,
+        "max_instances": 10,
+        "region": "us-east-1"
+    },
+    "analytics-service": {
+        "type": "cache",
+        "initial_instances": 5,  # MÁS INSTANCIAS para redundancia
+        "min_instances": 2,
+        "max_instances": 8,
+        "region": "us-east-1"
+    },
+    "file-storage": {
+        "type": "database",
+        "initial_instances": 5,  # MÁS INSTANCIAS - para fallos visibles
+        "min_instances": 1,      # Permitir fallar completamente
+        "max_instances": 8,
+        "region": "us-east-1"
+    },
+    "search-service": {
+        "type": "cache",
+        "initial_instances": 5,  # MÁS INSTANCIAS para redundancia
+        "min_instances": 2,
+        "max_instances": 8,
+        "region": "us-east-1"
+    },
+    "mobile-api": {
+        "type": "user-profile",
+        "initial_instances": 6,  # MUCHAS INSTANCIAS - API crítica
+        "min_instances": 2,
+        "max_instances": 9,
+        "region": "us-east-1"
+    },
+    "security-service": {
+        "type": "auth-service",
+        "initial_instances": 4,  # MÁS INSTANCIAS para redundancia
+        "min_instances": 2,
+        "max_instances": 7,
+        "region": "us-east-1"
+    },
+    "monitoring-service": {
+        "type": "database",
+        "initial_instances": 4,  # MÁS INSTANCIAS para redundancia
+        "min_instances": 2,
+        "max_instances": 7,
+        "region": "us-east-1"
+    },
+    "database": {
+        "type": "database",
+        "initial_instances": 6,  # MUCHAS INSTANCIAS - DB crítica
+        "min_instances": 3,      # MÍNIMO 3 para DB para estadísticas claras
+        "max_instances": 9,
+        "region": "us-east-1"
+    },
+    "cache": {
+        "type": "cache",
+        "initial_instances": 5,  # MÁS INSTANCIAS - para fallos claros
+        "min_instances": 2,      # AGRESIVO - Permitir bajar a 2
+        "max_instances": 8,
+        "region": "us-east-1"
+    }
+})
+
 class InteractiveDemo:
     """Demo interactivo súper visual y fácil de usar"""
     
@@ -36,6 +631,42 @@ class InteractiveDemo:
         self.system = None
         self.running = False
         self.demo_phase = 0
+        self._pending_error = None  # Error a mostrar en el próximo menú principal
+        
+        # En Windows 10+ una llamada vacía a os.system activa el procesamiento
+        # de secuencias ANSI en la consola; basta con hacerlo una vez
+        if os.name == 'nt':
+            os.system('')
+        
+        # Con readline, input() tiene historial (flecha arriba recupera la opción
+        # anterior) y edición de línea, sin cambiar nada más en los menús
+        if READLINE_AVAILABLE:
+            readline.set_history_length(100)
+        
+        # Tablas de despacho de los menús: opción -> método
+        self._main_actions = {
+            '1': self.quick_demo,
+            '2': self.interactive_experiments,
+            '3': self.visual_monitoring,
+            '4': self.chaos_scenarios,
+            '5': self.system_status,
+            '6': self.educational_mode,
+        }
+        self._experiment_actions = {
+            '1': self.interactive_chaos_monkey,
+            '2': self.interactive_latency,
+            '3': self.interactive_resource_exhaustion,
+            '4': self.interactive_multiple_chaos,
+            '5': self.interactive_health_check,
+        }
+        self._topic_actions = {
+            '1': self.explain_chaos_engineering,
+            '2': self.explain_distributed_systems,
+            '3': self.explain_experiment_types,
+            '4': self.explain_metrics,
+            '5': self.explain_resilience_patterns,
+            '6': self.explain_best_practices,
+        }
         
         # Configurar logging visual
         setup_colored_logging("INFO")
@@ -47,44 +678,20 @@ class InteractiveDemo:
         while True:
             choice = self.show_main_menu()
             
-            if choice == '1':
-                self.quick_demo()
-            elif choice == '2':
-                self.interactive_experiments()
-            elif choice == '3':
-                self.visual_monitoring()
-            elif choice == '4':
-                self.chaos_scenarios()
-            elif choice == '5':
-                self.system_status()
-            elif choice == '6':
-                self.educational_mode()
-            elif choice == '0':
+            if choice == '0':
                 self.cleanup_and_exit()
                 break
+            
+            action = self._main_actions.get(choice)
+            if action:
+                action()
             else:
                 self.print_error("❌ Opción inválida. Intenta de nuevo.")
                 
     def show_welcome(self):
         """Muestra la pantalla de bienvenida"""
         self.clear_screen()
-        print("""
-╔═══════════════════════════════════════════════════════════════╗
-║                                                               ║
-║    🔥 DEMO INTERACTIVO DE CHAOS ENGINEERING 🔥               ║
-║                                                               ║
-║    ┌─────────────────────────────────────────────────────┐   ║
-║    │  🏗️  Arquitectura Distribuida Simulada             │   ║
-║    │  🐒  Chaos Monkey Inteligente                       │   ║
-║    │  📊  Métricas en Tiempo Real                        │   ║
-║    │  🧪  Experimentos Interactivos                      │   ║
-║    │  📈  Reportes HTML Automáticos                      │   ║
-║    └─────────────────────────────────────────────────────┘   ║
-║                                                               ║
-║    🎯 Aprende Chaos Engineering de forma visual e interactiva ║
-║                                                               ║
-╚═══════════════════════════════════════════════════════════════╝
-        """)
+        print(_WELCOME_BANNER)
         self.wait_for_user()
         
     def show_main_menu(self):
@@ -93,24 +700,14 @@ class InteractiveDemo:
         services = len(self.system.services) if self.system else 0
         
         self.clear_screen()
-        print(f"""
-┌─────────────────── DEMO INTERACTIVO ───────────────────┐
-│                                                        │
-│  Estado: {status}    Servicios: {services:02d}                    │
-│                                                        │
-│  🚀 1. Demo Rápida (5 min) - ¡RECOMENDADO!            │
-│  🧪 2. Experimentos Interactivos                      │
-│  📊 3. Monitoreo Visual en Tiempo Real                │
-│  💥 4. Escenarios de Caos Avanzados                   │
-│  🔍 5. Estado del Sistema                             │
-│  📚 6. Modo Educativo                                 │
-│                                                       │
-│  🚪 0. Salir                                          │
-│                                                       │
-└───────────────────────────────────────────────────────┘
-        """)
+        print(_MAIN_MENU_HEADER + f"│  Estado: {status}    Servicios: {services:02d}                    │" + _MAIN_MENU_OPTIONS)
         
-        return input("🎯 Selecciona una opción: ").strip()
+        # Error de la selección anterior, justo encima del prompt
+        if self._pending_error:
+            print(self._pending_error)
+            self._pending_error = None
+        
+        return self._prompt("🎯 Selecciona una opción: ").strip()
         
     def quick_demo(self):
         """Demo rápida de 5 minutos súper visual"""
@@ -410,35 +1007,39 @@ class InteractiveDemo:
         
     def wait_for_experiments_completion(self):
         """Espera a que todos los experimentos activos terminen"""
-        if not self.system or not hasattr(self.system, 'experiment_runner') or not self.system.experiment_runner:
+        # Una sola búsqueda del runner; se reutiliza en todo el método
+        runner = getattr(self.system, 'experiment_runner', None)
+        if not runner:
             return
             
         print("   🔍 Verificando estado de experimentos...")
         
         max_wait_time = 30  # Máximo 30 segundos de espera
-        wait_time = 0
+        # Reloj monotónico con plazo absoluto: una sola lectura por iteración y
+        # sin acumular la deriva de las llamadas a get_all_experiments_status
+        deadline = time.monotonic() + max_wait_time
+        timed_out = True
         
-        while wait_time < max_wait_time:
-            status = self.system.experiment_runner.get_all_experiments_status()
+        while time.monotonic() < deadline:
+            status = runner.get_all_experiments_status()
             active_experiments = status.get('active_experiments', {})
             
             if not active_experiments:
                 print("   ✅ Todos los experimentos han finalizado")
+                timed_out = False
                 break
                 
             print(f"   ⏳ Esperando {len(active_experiments)} experimentos activos...")
             time.sleep(3)
-            wait_time += 3
         
-        if wait_time >= max_wait_time:
+        if timed_out:
             print("   ⚠️ Tiempo de espera agotado, continuando...")
         
         # Mostrar estadísticas finales de experimentos
-        if self.system.experiment_runner:
-            stats = self.system.experiment_runner.get_all_experiments_status().get('statistics', {})
-            total = stats.get('total_experiments', 0)
-            successful = stats.get('successful_experiments', 0)
-            print(f"   📊 Experimentos: {successful}/{total} exitosos")
+        stats = runner.get_all_experiments_status().get('statistics', {})
+        total = stats.get('total_experiments', 0)
+        successful = stats.get('successful_experiments', 0)
+        print(f"   📊 Experimentos: {successful}/{total} exitosos")
     
     def force_additional_instance_failures(self):
         """Fuerza fallos adicionales de instancias para reducir disponibilidad"""
@@ -477,8 +1078,6 @@ class InteractiveDemo:
         if not self.system or not self.system.services:
             return
         
-        import random
-        
         # PASO 0: DESHABILITAR auto-scaling temporalmente
         print("   🚫 Deshabilitando auto-scaling temporalmente...")
         original_auto_scaling = {}
@@ -607,8 +1206,6 @@ class InteractiveDemo:
         if not self.system or not self.system.services:
             return
         
-        import random
-        
         # Configuración SÚPER DIRECTA - terminar instancias AHORA
         final_config = {
             "notification-service": 5,  # Dejar 5 vivas de las que tenga
@@ -644,7 +1241,6 @@ class InteractiveDemo:
                                 instance = service.instances[instance_id]
                                 # MARCAR como fallida en lugar de eliminar
                                 instance.status = "DOWN"
-                                instance.is_healthy = False
                                 instance.error_probability = 1.0  # 100% errores
                                 print(f"       💥 MARCADA COMO FALLIDA: {instance_id}")
                             except Exception as e:
@@ -674,7 +1270,7 @@ class InteractiveDemo:
                 else:
                     # Mostrar instancias saludables vs total
                     healthy_count = sum(1 for inst in service.instances.values() 
-                                      if getattr(inst, 'is_healthy', True) and getattr(inst, 'status', 'UP') != 'DOWN')
+                                      if getattr(inst, 'status', 'UP') != 'DOWN')
                     print(f"     ✅ {service_name}: {healthy_count}/{final_count} instancias saludables")
         
         print("   🎯 Estadísticas finales aplicadas AHORA!")
@@ -693,33 +1289,19 @@ class InteractiveDemo:
 Selecciona el experimento que quieres ejecutar:
         """)
         
-        experiments = [
-            ("1", "🐒 Chaos Monkey", "Terminar instancias aleatoriamente"),
-            ("2", "🌐 Network Latency", "Introducir delays de red"),
-            ("3", "💾 Resource Exhaustion", "Agotar CPU/memoria"),
-            ("4", "🔥 Multiple Chaos", "Varios experimentos simultáneos"),
-            ("5", "🩺 Health Check", "Diagnóstico del sistema"),
-        ]
-        
-        for num, name, desc in experiments:
+        for num, name, desc in _EXPERIMENT_MENU:
             print(f"  {num}. {name} - {desc}")
             
         print("  0. Volver al menú principal")
         
-        choice = input("\n🎯 Selecciona experimento: ").strip()
-        
-        if choice == '1':
-            self.interactive_chaos_monkey()
-        elif choice == '2':
-            self.interactive_latency()
-        elif choice == '3':
-            self.interactive_resource_exhaustion()
-        elif choice == '4':
-            self.interactive_multiple_chaos()
-        elif choice == '5':
-            self.interactive_health_check()
-        elif choice == '0':
+        choice = self._prompt("\n🎯 Selecciona experimento: ").strip()
+        
+        if choice == '0':
             return
+        
+        action = self._experiment_actions.get(choice)
+        if action:
+            action()
         else:
             self.print_error("❌ Opción inválida")
             
@@ -728,25 +1310,131 @@ Selecciona el experimento que quieres ejecutar:
         if not self.ensure_system_running():
             return
             
-        self.clear_screen()
+        # Con stdout redirigido (tee, archivo de log) no se redibuja la pantalla:
+        # se agrega una línea CSV compacta por servicio en cada actualización
+        is_tty = sys.stdout.isatty()
+        
+        if is_tty:
+            self.clear_screen()
         print("""
 📊 MONITOREO VISUAL EN TIEMPO REAL
 ════════════════════════════════════
 
-Actualizando cada 3 segundos... (Ctrl+C para parar)
+Actualizando cada 3 segundos (más espaciado si no hay cambios)... (Ctrl+C para parar)
         """)
         
+        # El dibujado va en un hilo aparte: una terminal lenta (p. ej. por SSH) no
+        # retrasa el muestreo. La cola de tamaño 1 solo guarda el último frame.
+        frames = queue.Queue(maxsize=1)
+        stop = threading.Event()
+        
+        # Duración (ns) de cada fase del ciclo; se resume al detener el monitoreo
+        phase_times = {phase: deque(maxlen=_POLL_STATS_SAMPLES) for phase in ("muestreo", "formato", "dibujado")}
+        renderer = threading.Thread(
+            target=self._render_frames, args=(frames, stop, phase_times["dibujado"], not is_tty), daemon=True
+        )
+        
         try:
+            # Se limpia una sola vez; después solo se reescriben las líneas que cambian
+            if is_tty:
+                self.clear_screen()
+            else:
+                print("uptime_s,servicio,disponibilidad,respuesta_ms,error_rate,instancias")
+            renderer.start()
+            previous_key = None
+            interval = _MONITOR_INTERVAL
+            # Plazo absoluto sobre reloj monotónico: el tiempo de recolección y
+            # dibujado no se suma al periodo, así la cadencia no deriva
+            deadline = time.monotonic()
             while True:
+                t0 = time.perf_counter_ns()
                 status = self.system.get_system_status()
-                self.clear_screen()
-                print("📊 MÉTRICAS DEL SISTEMA - TIEMPO REAL")
-                print("=" * 50)
-                self.show_detailed_metrics(status)
-                time.sleep(3)
+                t1 = time.perf_counter_ns()
+                if is_tty:
+                    lines = ["📊 MÉTRICAS DEL SISTEMA - TIEMPO REAL", "=" * 50]
+                    lines.extend(self.format_detailed_metrics(status))
+                    key = lines[3:]  # La línea de uptime (índice 2) cambia siempre
+                else:
+                    key = self.format_metrics_csv(status)
+                    uptime = f"{status.get('uptime_seconds', 0):.0f}"
+                    lines = [f"{uptime},{row}" for row in key]
+                phase_times["muestreo"].append(t1 - t0)
+                phase_times["formato"].append(time.perf_counter_ns() - t1)
+                
+                # Si las métricas de servicios no cambiaron, espaciar la próxima muestra
+                if key == previous_key:
+                    interval = min(interval * 2, _MONITOR_MAX_INTERVAL)
+                else:
+                    interval = _MONITOR_INTERVAL
+                previous_key = key
+                
+                # Si el hilo de dibujado va atrasado, se descarta el frame pendiente
+                try:
+                    frames.get_nowait()
+                except queue.Empty:
+                    pass
+                frames.put_nowait(lines)
+                deadline += interval
+                now = time.monotonic()
+                # Si el proceso estuvo suspendido (Ctrl+Z) o detenido, no se
+                # recuperan los ticks perdidos en ráfaga: se retoma desde ahora
+                if deadline < now:
+                    deadline = now
+                time.sleep(deadline - now)
         except KeyboardInterrupt:
-            print("\n✅ Monitoreo detenido")
-            self.wait_for_user()
+            pass  # Ctrl+C es la forma normal de salir del monitoreo
+        finally:
+            # También ante cualquier otro error (p. ej. de get_system_status):
+            # el hilo de dibujado no debe quedar vivo al salir
+            stop.set()
+            if renderer.is_alive():
+                renderer.join(timeout=1)
+        
+        print("\n✅ Monitoreo detenido")
+        self.log_poll_stats(phase_times)
+        self.wait_for_user()
+            
+    def _render_frames(self, frames: "queue.Queue", stop: threading.Event, render_times: deque,
+                       append_only: bool = False):
+        """
+        Hilo de dibujado del monitoreo visual: redibuja cada frame recibido, o
+        con append_only (salida redirigida) solo agrega sus líneas al final.
+        """
+        drawn = []
+        while not stop.is_set():
+            try:
+                lines = frames.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            t0 = time.perf_counter_ns()
+            if append_only:
+                _write_raw("\n".join(lines) + "\n")
+            else:
+                self.redraw_frame(lines, drawn)
+            render_times.append(time.perf_counter_ns() - t0)
+            drawn = lines
+            
+    def log_poll_stats(self, phase_times: Dict[str, deque]):
+        """Registra en debug p50/p95/p99 (ms) de cada fase del ciclo de monitoreo"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        # Importación diferida: solo se usa al salir del monitoreo visual
+        import statistics
+        
+        for phase, samples in phase_times.items():
+            # Copia: si el hilo de dibujado sigue vivo tras el join con timeout,
+            # aún puede agregar muestras mientras se recorren
+            samples = list(samples)
+            if not samples:
+                continue
+            if len(samples) > 1:
+                cuts = statistics.quantiles(samples, n=100)
+                p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+            else:
+                p50 = p95 = p99 = samples[0]
+            logger.debug(f"Tiempos de monitoreo (ms) {phase}: p50 {p50 / 1e6:.2f} | "
+                         f"p95 {p95 / 1e6:.2f} | p99 {p99 / 1e6:.2f} | n={len(samples)}")
             
     def chaos_scenarios(self):
         """Escenarios de caos avanzados"""
@@ -762,21 +1450,13 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
 ⚠️  ATENCIÓN: Estos son experimentos más destructivos
         """)
         
-        scenarios = [
-            ("1", "🦍 Chaos Gorilla", "Falla de zona completa", "DESTRUCTIVO"),
-            ("2", "🔥 Cascade Failure", "Falla en cascada", "MUY DESTRUCTIVO"),
-            ("3", "🌊 Traffic Spike", "Pico masivo de tráfico", "MODERADO"),
-            ("4", "🧨 Database Chaos", "Fallas en base de datos", "DESTRUCTIVO"),
-            ("5", "🔌 Network Partition", "Partición de red", "MODERADO"),
-        ]
-        
-        for num, name, desc, level in scenarios:
-            color = "🔴" if "DESTRUCTIVO" in level else "🟡"
+        for num, name, desc, level in _SCENARIO_MENU:
+            color = _RISK_ICONS[level]
             print(f"  {num}. {color} {name} - {desc} ({level})")
             
         print("  0. Volver al menú principal")
         
-        choice = input("\n⚠️ Selecciona escenario (con cuidado): ").strip()
+        choice = self._prompt("\n⚠️ Selecciona escenario (con cuidado): ").strip()
         
         if choice in ['1', '2', '4']:
             if self.confirm("⚠️ Este experimento es DESTRUCTIVO. ¿Continuar?"):
@@ -829,22 +1509,14 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
             
         print("  0. Volver al menú principal")
         
-        choice = input("\n📖 Selecciona tema: ").strip()
-        
-        if choice == '1':
-            self.explain_chaos_engineering()
-        elif choice == '2':
-            self.explain_distributed_systems()
-        elif choice == '3':
-            self.explain_experiment_types()
-        elif choice == '4':
-            self.explain_metrics()
-        elif choice == '5':
-            self.explain_resilience_patterns()
-        elif choice == '6':
-            self.explain_best_practices()
-        elif choice == '0':
+        choice = self._prompt("\n📖 Selecciona tema: ").strip()
+        
+        if choice == '0':
             return
+        
+        action = self._topic_actions.get(choice)
+        if action:
+            action()
         else:
             self.print_error("❌ Opción inválida")
             
@@ -890,27 +1562,34 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
         """Muestra métricas en tiempo real"""
         services = status.get('services', {})
         
-        print("\r", end="")  # Limpiar línea
+        summary = summarize_services(services)
+        total_instances = summary['total_instances']
+        healthy_instances = summary['healthy_instances']
+        avg_availability = summary['avg_availability']
         
-        total_instances = sum(s.get('total_instances', 0) for s in services.values())
-        healthy_instances = sum(s.get('healthy_instances', 0) for s in services.values())
-        avg_availability = sum(s.get('availability', 0) for s in services.values()) / len(services) if services else 0
-        
-        print(f"""
+        # Todo el bloque (incluido el retorno de carro) en una sola escritura y un flush
+        sys.stdout.write(f"""\r
 ┌─────────────────── MÉTRICAS LIVE ────────────────────┐
 │  🟢 Instancias saludables: {healthy_instances:02d}/{total_instances:02d}                  │
 │  📊 Disponibilidad promedio: {avg_availability:05.1f}%                │
 │  ⏱️ Tiempo transcurrido: {time.time() - self.system.start_time:05.0f}s               │
 └──────────────────────────────────────────────────────┘
-        """, end="", flush=True)
+        """)
+        sys.stdout.flush()
         
     def show_detailed_metrics(self, status: Dict):
         """Muestra métricas detalladas"""
+        self.print_lines(self.format_detailed_metrics(status))
+        
+    def format_detailed_metrics(self, status: Dict) -> List[str]:
+        """Construye las líneas de métricas detalladas (una por servicio)"""
         services = status.get('services', {})
         uptime = status.get('uptime_seconds', 0)
         
-        print(f"⏱️ Uptime: {uptime:.0f}s | 🟢 Sistema: {'FUNCIONANDO' if status.get('is_running') else 'PARADO'}")
-        print()
+        lines = [
+            f"⏱️ Uptime: {uptime:.0f}s | 🟢 Sistema: {'FUNCIONANDO' if status.get('is_running') else 'PARADO'}",
+            ""
+        ]
         
         for service_name, service_data in services.items():
             availability = service_data.get('availability', 0)
@@ -919,10 +1598,20 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
             response_time = service_data.get('avg_response_time_ms', 0)
             error_rate = service_data.get('error_rate', 0)
             
-            status_icon = "🟢" if availability > 90 else "🟡" if availability > 70 else "🔴"
+            status_icon = _HEALTH_ICONS[_health_level(availability)]
             
-            print(f"{status_icon} {service_name:15} | {healthy:02d}/{total:02d} inst | {availability:05.1f}% | {response_time:05.0f}ms | {error_rate:04.1f}% err")
+            lines.append(f"{status_icon} {service_name:15} | {healthy:02d}/{total:02d} inst | {availability:05.1f}% | {response_time:05.0f}ms | {error_rate:04.1f}% err")
+        
+        return lines
             
+    def format_metrics_csv(self, status: Dict) -> List[str]:
+        """Una fila CSV por servicio (disponibilidad, respuesta, errores, instancias) para salida no interactiva"""
+        return [
+            f"{name},{data.get('availability', 0):.1f},{data.get('avg_response_time_ms', 0):.2f},"
+            f"{data.get('error_rate', 0):.3f},{data.get('healthy_instances', 0)}/{data.get('total_instances', 0)}"
+            for name, data in status.get('services', {}).items()
+        ]
+        
     def show_system_health(self, status: Dict):
         """Muestra análisis de salud del sistema"""
         services = status.get('services', {})
@@ -932,8 +1621,9 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
             return
             
         total_services = len(services)
-        healthy_services = sum(1 for s in services.values() if s.get('availability', 0) > 90)
-        avg_availability = sum(s.get('availability', 0) for s in services.values()) / total_services
+        summary = summarize_services(services)
+        healthy_services = summary['healthy_services']
+        avg_availability = summary['avg_availability']
         
         health_status = "🟢 EXCELENTE" if avg_availability > 95 else \
                        "🟡 BUENO" if avg_availability > 85 else \
@@ -965,31 +1655,35 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
         
     def show_comprehensive_status(self, status: Dict):
         """Estado completo del sistema"""
-        print(f"🟢 Sistema iniciado: {status.get('is_running', False)}")
-        print(f"⏱️ Uptime: {status.get('uptime_seconds', 0):.0f} segundos")
-        print()
+        lines = [
+            f"🟢 Sistema iniciado: {status.get('is_running', False)}",
+            f"⏱️ Uptime: {status.get('uptime_seconds', 0):.0f} segundos",
+            ""
+        ]
         
         # Servicios
         services = status.get('services', {})
-        print("🏗️ SERVICIOS:")
+        lines.append("🏗️ SERVICIOS:")
         for name, data in services.items():
-            print(f"  • {name}: {data.get('healthy_instances', 0)}/{data.get('total_instances', 0)} instancias ({data.get('availability', 0):.1f}%)")
-        print()
+            lines.append(f"  • {name}: {data.get('healthy_instances', 0)}/{data.get('total_instances', 0)} instancias ({data.get('availability', 0):.1f}%)")
+        lines.append("")
         
         # Load Balancer
         lb_data = status.get('load_balancer', {})
         if lb_data:
-            print("⚖️ LOAD BALANCER:")
-            print(f"  • Requests totales: {lb_data.get('total_requests', 0)}")
-            print(f"  • Tasa de errores: {lb_data.get('error_rate', 0):.1f}%")
-        print()
+            lines.append("⚖️ LOAD BALANCER:")
+            lines.append(f"  • Requests totales: {lb_data.get('total_requests', 0)}")
+            lines.append(f"  • Tasa de errores: {lb_data.get('error_rate', 0):.1f}%")
+        lines.append("")
         
         # Experimentos
         experiments = status.get('experiments', {})
         if experiments:
             active = experiments.get('active_experiments', {})
-            print(f"🧪 EXPERIMENTOS: {len(active)} activos")
-        print()
+            lines.append(f"🧪 EXPERIMENTOS: {len(active)} activos")
+        lines.append("")
+        
+        self.print_lines(lines)
         
     def run_chaos_monkey_visual(self):
         """Ejecuta chaos monkey con visualización educativa"""
@@ -1000,7 +1694,7 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
         
         # Ejecutar experimento de terminación de instancias
         try:
-            services = list(self.system.services.keys())
+            services = self._service_names()
             if services:
                 target_service = services[0]
                 print(f"   🎯 Objetivo: {target_service} (servicio crítico)")
@@ -1017,9 +1711,10 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
                     print("   ⏳ ¿Se activará auto-scaling? ¿Habrá alertas?")
                     
                     # Registrar experimento manualmente en las métricas
-                    if hasattr(self.system, 'experiment_runner') and self.system.experiment_runner:
-                        self.system.experiment_runner.total_experiments += 1
-                        self.system.experiment_runner.successful_experiments += 1
+                    runner = getattr(self.system, 'experiment_runner', None)
+                    if runner:
+                        runner.total_experiments += 1
+                        runner.successful_experiments += 1
                 else:
                     print(f"   🛡️ PROTECCIÓN ACTIVA: {result.get('message', 'Sistema protegido')}")
                     print("   💡 Esto es bueno: el sistema evitó un fallo peligroso")
@@ -1043,7 +1738,7 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
         print()
         
         try:
-            services = list(self.system.services.keys())
+            services = self._service_names()
             if services:
                 target_service = services[0]
                 print(f"   🎯 Objetivo: {target_service}")
@@ -1086,7 +1781,7 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
         print()
         
         try:
-            services = list(self.system.services.keys())
+            services = self._service_names()
             if services:
                 target_service = services[-1]  # Último servicio
                 print(f"   🎯 Objetivo: {target_service}")
@@ -1127,29 +1822,30 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
         print("🐒 CHAOS MONKEY INTERACTIVO")
         print("=" * 30)
         
-        services = list(self.system.services.keys())
+        services = self._service_names()
         if not services:
             print("❌ No hay servicios configurados")
             self.wait_for_user()
             return
             
-        print("Servicios disponibles:")
+        lines = ["Servicios disponibles:"]
         for i, service in enumerate(services, 1):
             status = self.system.services[service].get_service_metrics()
             instances = f"{status.get('healthy_instances', 0)}/{status.get('total_instances', 0)}"
-            print(f"  {i}. {service} ({instances} instancias)")
+            lines.append(f"  {i}. {service} ({instances} instancias)")
+        self.print_lines(lines)
             
         print("  0. Terminar aleatoriamente")
         
-        choice = input("\n🎯 Selecciona servicio objetivo (0 para aleatorio): ").strip()
+        choice = self._prompt("\n🎯 Selecciona servicio objetivo (0 para aleatorio): ").strip()
         
         try:
             if choice == '0':
                 result = self.system.force_chaos_monkey()
             else:
-                idx = int(choice) - 1
-                if 0 <= idx < len(services):
-                    result = self.system.force_chaos_monkey(services[idx])
+                idx = _parse_int(choice, 1, len(services))
+                if idx is not None:
+                    result = self.system.force_chaos_monkey(services[idx - 1])
                 else:
                     print("❌ Opción inválida")
                     self.wait_for_user()
@@ -1163,8 +1859,6 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
             else:
                 print(f"\n🛡️ BLOQUEADO: {result.get('message')}")
                 
-        except ValueError:
-            print("❌ Entrada inválida")
         except Exception as e:
             print(f"❌ Error: {e}")
             
@@ -1176,35 +1870,20 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
         print("🌐 EXPERIMENTO DE LATENCIA INTERACTIVO")
         print("=" * 40)
         
-        services = list(self.system.services.keys())
-        if not services:
-            print("❌ No hay servicios configurados")
-            self.wait_for_user()
+        target_service = self._select_service()
+        if target_service is None:
             return
             
-        # Seleccionar servicio
-        print("Servicios disponibles:")
-        for i, service in enumerate(services, 1):
-            print(f"  {i}. {service}")
-            
         try:
-            choice = int(input("\n🎯 Selecciona servicio: ").strip()) - 1
-            if not (0 <= choice < len(services)):
-                print("❌ Opción inválida")
-                self.wait_for_user()
-                return
-                
-            target_service = services[choice]
-            
             # Configurar latencia
-            latency = int(input("⏱️ Latencia en ms (100-2000): ").strip())
-            if not (100 <= latency <= 2000):
+            latency = _parse_int(self._prompt("⏱️ Latencia en ms (100-2000): "), 100, 2000)
+            if latency is None:
                 print("❌ Latencia debe estar entre 100-2000ms")
                 self.wait_for_user()
                 return
                 
-            duration = int(input("⏰ Duración en segundos (30-300): ").strip())
-            if not (30 <= duration <= 300):
+            duration = _parse_int(self._prompt("⏰ Duración en segundos (30-300): "), 30, 300)
+            if duration is None:
                 print("❌ Duración debe estar entre 30-300s")
                 self.wait_for_user()
                 return
@@ -1234,8 +1913,6 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
                 
             print("\n✅ Experimento completado!")
             
-        except ValueError:
-            print("❌ Entrada inválida")
         except Exception as e:
             print(f"❌ Error: {e}")
             
@@ -1247,33 +1924,18 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
         print("💾 EXPERIMENTO DE AGOTAMIENTO DE RECURSOS")
         print("=" * 45)
         
-        services = list(self.system.services.keys())
-        if not services:
-            print("❌ No hay servicios configurados")
-            self.wait_for_user()
+        target_service = self._select_service()
+        if target_service is None:
             return
             
-        # Seleccionar servicio
-        print("Servicios disponibles:")
-        for i, service in enumerate(services, 1):
-            print(f"  {i}. {service}")
-            
         try:
-            choice = int(input("\n🎯 Selecciona servicio: ").strip()) - 1
-            if not (0 <= choice < len(services)):
-                print("❌ Opción inválida")
-                self.wait_for_user()
-                return
-                
-            target_service = services[choice]
-            
             # Tipo de recurso
             print("\nTipos de recursos:")
             print("  1. CPU")
             print("  2. Memoria")
             print("  3. Disco I/O")
             
-            resource_choice = input("💾 Selecciona recurso (1-3): ").strip()
+            resource_choice = self._prompt("💾 Selecciona recurso (1-3): ").strip()
             resource_map = {'1': 'cpu', '2': 'memory', '3': 'disk'}
             
             if resource_choice not in resource_map:
@@ -1284,8 +1946,8 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
             resource_type = resource_map[resource_choice]
             
             # Duración
-            duration = int(input("⏰ Duración en segundos (30-180): ").strip())
-            if not (30 <= duration <= 180):
+            duration = _parse_int(self._prompt("⏰ Duración en segundos (30-180): "), 30, 180)
+            if duration is None:
                 print("❌ Duración debe estar entre 30-180s")
                 self.wait_for_user()
                 return
@@ -1315,8 +1977,6 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
                 
             print("\n✅ Experimento completado!")
             
-        except ValueError:
-            print("❌ Entrada inválida")
         except Exception as e:
             print(f"❌ Error: {e}")
             
@@ -1331,7 +1991,7 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
         if not self.confirm("⚠️ Esto ejecutará varios experimentos a la vez. ¿Continuar?"):
             return
             
-        services = list(self.system.services.keys())
+        services = self._service_names()
         if len(services) < 2:
             print("❌ Se necesitan al menos 2 servicios")
             self.wait_for_user()
@@ -1380,7 +2040,7 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
                 time.sleep(10)
                 print(f"   ⏳ Tiempo: {(i+1)*10}/60 segundos")
                 status = self.system.get_system_status()
-                avg_availability = sum(s.get('availability', 0) for s in status.get('services', {}).values()) / len(status.get('services', {})) if status.get('services') else 0
+                avg_availability = summarize_services(status.get('services', {}))['avg_availability']
                 print(f"   📊 Disponibilidad promedio: {avg_availability:.1f}%")
                 
             print("\n✅ Experimentos múltiples completados!")
@@ -1422,24 +2082,27 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
             if not services:
                 print("❌ No hay servicios para diagnosticar")
             else:
-                total_instances = sum(s.get('total_instances', 0) for s in services.values())
-                healthy_instances = sum(s.get('healthy_instances', 0) for s in services.values())
-                avg_availability = sum(s.get('availability', 0) for s in services.values()) / len(services)
+                summary = summarize_services(services)
+                total_instances = summary['total_instances']
+                healthy_instances = summary['healthy_instances']
+                avg_availability = summary['avg_availability']
                 
                 print(f"   🟢 Instancias saludables: {healthy_instances}/{total_instances}")
                 print(f"   📊 Disponibilidad promedio: {avg_availability:.1f}%")
                 
                 # Análisis por servicio
-                print("\n   📝 Análisis por servicio:")
+                lines = ["\n   📝 Análisis por servicio:"]
                 for service_name, service_data in services.items():
                     availability = service_data.get('availability', 0)
                     instances = f"{service_data.get('healthy_instances', 0)}/{service_data.get('total_instances', 0)}"
                     
-                    status_icon = "🟢" if availability > 90 else "🟡" if availability > 70 else "🔴"
-                    recommendation = "OK" if availability > 90 else "Revisar" if availability > 70 else "CRÍTICO"
-                    
-                    print(f"     {status_icon} {service_name}: {instances} inst, {availability:.1f}% - {recommendation}")
+                    level = _health_level(availability)
+                    status_icon = _HEALTH_ICONS[level]
+                    recommendation = _HEALTH_RECOMMENDATIONS[level]
                     
+                    lines.append(f"     {status_icon} {service_name}: {instances} inst, {availability:.1f}% - {recommendation}")
+                self.print_lines(lines)
+                
                 # Recomendaciones
                 print("\n   💡 RECOMENDACIONES:")
                 if avg_availability > 95:
@@ -1492,16 +2155,30 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
                 
         elif choice == '2':  # Cascade Failure
             print("🔥 Iniciando falla en cascada...")
-            services = list(self.system.services.keys())
-            
-            for i, service in enumerate(services):
-                print(f"   💥 Afectando {service}...")
-                try:
-                    self.system.force_chaos_monkey(service)
-                    time.sleep(5)
-                except:
-                    pass
-                    
+            services = self._service_names()
+            failures = []
+
+            if services:
+                # Importación diferida: solo este escenario usa el pool de hilos
+                from concurrent.futures import ThreadPoolExecutor, as_completed
+                
+                with ThreadPoolExecutor(max_workers=len(services)) as executor:
+                    futures = {}
+                    for service in services:
+                        print(f"   💥 Afectando {service}...")
+                        futures[executor.submit(self.system.force_chaos_monkey, service)] = service
+
+                    for future in as_completed(futures):
+                        try:
+                            future.result()
+                        except Exception as e:
+                            failures.append((futures[future], e))
+
+            if failures:
+                print(f"\n   ⚠️ {len(failures)} servicio(s) rechazaron la inyección:")
+                for service, error in failures:
+                    print(f"     ❌ {service}: {error}")
+
         elif choice == '4':  # Database Chaos
             print("🧨 Caos en base de datos...")
             db_services = [s for s in self.system.services.keys() if 'db' in s.lower() or 'database' in s.lower()]
@@ -1547,7 +2224,7 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
             
         elif choice == '5':  # Network Partition
             print("🔌 Simulando partición de red...")
-            services = list(self.system.services.keys())
+            services = self._service_names()
             
             if len(services) >= 2:
                 partition_size = len(services) // 2
@@ -1576,347 +2253,37 @@ Actualizando cada 3 segundos... (Ctrl+C para parar)
     def explain_chaos_engineering(self):
         """Explica qué es Chaos Engineering"""
         self.clear_screen()
-        print("""
-❓ ¿QUÉ ES CHAOS ENGINEERING?
-═══════════════════════════════════
-
-Chaos Engineering es una disciplina que consiste en experimentar con 
-sistemas distribuidos para descubrir debilidades antes de que se 
-manifiesten como comportamientos aberrantes en producción.
-
-🎯 OBJETIVOS PRINCIPALES:
-   • Encontrar puntos únicos de falla
-   • Probar la efectividad de mecanismos de fallback
-   • Mejorar la resiliencia del sistema
-   • Generar confianza en la infraestructura
-
-📈 HISTORIA:
-   • 2010: Netflix introduce "Chaos Monkey"
-   • 2012: Evolución hacia "Simian Army"
-   • 2017: Principios de Chaos Engineering publicados
-   • Hoy: Adoptado por Amazon, Google, Facebook, Microsoft
-
-🔬 METODOLOGÍA:
-   1. Definir el "estado estable" del sistema
-   2. Hipotetizar que el estado se mantendrá
-   3. Introducir variables del mundo real (fallas)
-   4. Intentar refutar la hipótesis
-
-💡 BENEFICIOS:
-   • Reducción de incidentes en producción
-   • Mejor comprensión del sistema
-   • Identificación proactiva de problemas
-   • Incremento en la confianza del equipo
-        """)
-        self.wait_for_user()
-        
-    def explain_distributed_systems(self):
-        """Explica arquitecturas distribuidas"""
-        self.clear_screen()
-        print("""
-🏗️ ARQUITECTURAS DISTRIBUIDAS
-════════════════════════════════
-
-Los sistemas distribuidos son colecciones de computadoras independientes
-que aparecen ante los usuarios como un sistema único y coherente.
-
-🔧 COMPONENTES PRINCIPALES:
-
-   🌐 API Gateway:
-      • Punto de entrada único
-      • Enrutamiento de requests
-      • Autenticación y autorización
-      • Rate limiting
-
-   🔐 Servicios de Autenticación:
-      • Gestión de identidades
-      • Tokens y sesiones
-      • Control de acceso
-
-   👥 Microservicios:
-      • Servicios independientes
-      • Responsabilidad única
-      • Comunicación via APIs
-
-   💾 Capa de Datos:
-      • Bases de datos distribuidas
-      • Cache distribuido
-      • Consistencia eventual
-
-   ⚖️ Balanceadores de Carga:
-      • Distribución de tráfico
-      • Health checks
-      • Failover automático
-
-⚠️ DESAFÍOS:
-   • Latencia de red
-   • Fallas parciales
-   • Consistencia de datos
-   • Complejidad operacional
-
-🎯 BENEFICIOS:
-   • Escalabilidad
-   • Resiliencia
-   • Flexibilidad tecnológica
-   • Independencia de equipos
-        """)
+        print(_TEXT_CHAOS_ENGINEERING)
+        self.wait_for_user()
+        
+    def explain_distributed_systems(self):
+        """Explica arquitecturas distribuidas"""
+        self.clear_screen()
+        print(_TEXT_DISTRIBUTED_SYSTEMS)
         self.wait_for_user()
         
     def explain_experiment_types(self):
         """Explica tipos de experimentos"""
         self.clear_screen()
-        print("""
-🧪 TIPOS DE EXPERIMENTOS DE CHAOS
-══════════════════════════════════════
-
-🐒 CHAOS MONKEY (Básico):
-   • Terminación aleatoria de instancias
-   • Primer nivel de chaos engineering
-   • Prueba redundancia y failover
-
-🌐 EXPERIMENTOS DE RED:
-   • Latency Monkey: Delays artificiales
-   • Network Partition: Aislamiento de servicios
-   • Packet Loss: Pérdida de paquetes
-
-💾 AGOTAMIENTO DE RECURSOS:
-   • CPU Exhaustion: Consumo al 100%
-   • Memory Exhaustion: Agotamiento de RAM
-   • Disk I/O: Saturación de disco
-
-🦍 CHAOS GORILLA (Destructivo):
-   • Falla de zona completa
-   • Afecta múltiples servicios
-   • Prueba recuperación regional
-
-🧨 CHAOS KONG (Muy Destructivo):
-   • Falla de región completa
-   • Máximo nivel de destrucción
-   • Solo en entornos seguros
-
-🩺 EXPERIMENTOS DE DIAGNÓSTICO:
-   • Doctor Monkey: Health checks
-   • Performance Monitor: Análisis de rendimiento
-   • Security Monkey: Vulnerabilidades
-
-📊 NIVELES DE RIESGO:
-   🟢 Bajo: Chaos Monkey, Latency
-   🟡 Medio: Resource Exhaustion, Network Partition
-   🔴 Alto: Chaos Gorilla, Database Failures
-   ⚫ Crítico: Chaos Kong, Regional Failures
-
-💡 MEJORES PRÁCTICAS:
-   • Comenzar con experimentos simples
-   • Incrementar complejidad gradualmente
-   • Tener plan de rollback
-   • Monitorear métricas clave
-        """)
+        print(_TEXT_EXPERIMENT_TYPES)
         self.wait_for_user()
         
     def explain_metrics(self):
         """Explica métricas y monitoreo"""
         self.clear_screen()
-        print("""
-📊 MÉTRICAS Y MONITOREO
-═══════════════════════════
-
-📈 MÉTRICAS FUNDAMENTALES:
-
-   ⏱️ LATENCIA:
-      • Tiempo de respuesta promedio
-      • Percentiles P50, P95, P99
-      • Timeout rates
-
-   🚀 THROUGHPUT:
-      • Requests por segundo (RPS)
-      • Transacciones por minuto
-      • Bandwidth utilizado
-
-   ❌ ERROR RATE:
-      • Porcentaje de errores
-      • Códigos de estado HTTP
-      • Timeouts y fallos
-
-   📊 DISPONIBILIDAD:
-      • Uptime percentage
-      • SLA compliance
-      • MTTR (Mean Time To Recovery)
-      • MTBF (Mean Time Between Failures)
-
-🎯 GOLDEN SIGNALS:
-   1. Latency - ¿Qué tan rápido?
-   2. Traffic - ¿Cuánto tráfico?
-   3. Errors - ¿Qué está fallando?
-   4. Saturation - ¿Qué tan lleno?
-
-📱 TIPOS DE ALERTAS:
-
-   🔴 CRÍTICAS:
-      • Sistema completamente caído
-      • Pérdida de datos
-      • Seguridad comprometida
-
-   🟠 ALTAS:
-      • SLA en riesgo
-      • Degradación significativa
-      • Recursos agotándose
-
-   🟡 MEDIAS:
-      • Tendencias preocupantes
-      • Umbrales preventivos
-      • Anomalías detectadas
-
-🛠️ HERRAMIENTAS COMUNES:
-   • Prometheus + Grafana
-   • DataDog
-   • New Relic
-   • CloudWatch
-
-💡 MEJORES PRÁCTICAS:
-   • Definir SLOs claros
-   • Alertas accionables
-   • Dashboards por audiencia
-   • Retención de datos históricos
-        """)
+        print(_TEXT_METRICS)
         self.wait_for_user()
         
     def explain_resilience_patterns(self):
         """Explica patrones de resiliencia"""
         self.clear_screen()
-        print("""
-🔄 PATRONES DE RESILIENCIA
-═══════════════════════════════
-
-🛡️ CIRCUIT BREAKER:
-   • Previene cascadas de fallas
-   • Estados: Closed, Open, Half-Open
-   • Failfast cuando hay problemas
-   • Recuperación automática
-
-🏰 BULKHEAD:
-   • Aislamiento de recursos
-   • Compartimentos separados
-   • Falla aislada no afecta todo
-   • Pool de conexiones segregado
-
-🔄 RETRY CON BACKOFF:
-   • Reintentos inteligentes
-   • Backoff exponencial
-   • Jitter para evitar thundering herd
-   • Máximo número de intentos
-
-⏰ TIMEOUT:
-   • Límites de tiempo de espera
-   • Evita recursos bloqueados
-   • Configuración por operación
-   • Cascading timeouts
-
-🎭 FALLBACK:
-   • Respuestas de emergencia
-   • Graceful degradation
-   • Cache como fallback
-   • Respuestas por defecto
-
-⚖️ RATE LIMITING:
-   • Control de tráfico
-   • Previene sobrecarga
-   • Token bucket algorithm
-   • Sliding window
-
-🔀 LOAD BALANCING:
-   • Distribución de carga
-   • Health checks
-   • Algoritmos: Round Robin, Least Connections
-   • Sticky sessions
-
-📦 CACHING:
-   • Reducción de latencia
-   • Offload de servicios backend
-   • Cache invalidation strategies
-   • Multi-level caching
-
-💡 IMPLEMENTACIÓN:
-   • Combinar múltiples patrones
-   • Configuración por servicio
-   • Monitoreo de efectividad
-   • Testing de patrones
-        """)
+        print(_TEXT_RESILIENCE_PATTERNS)
         self.wait_for_user()
         
     def explain_best_practices(self):
         """Explica mejores prácticas"""
         self.clear_screen()
-        print("""
-🎯 MEJORES PRÁCTICAS DE CHAOS ENGINEERING
-═══════════════════════════════════════════
-
-🚀 COMENZANDO:
-
-   📋 1. PREPARACIÓN:
-      • Definir estado estable del sistema
-      • Establecer métricas baseline
-      • Identificar servicios críticos
-      • Crear plan de rollback
-
-   🎯 2. HIPÓTESIS:
-      • Específica y medible
-      • "El sistema mantendrá X disponibilidad cuando..."
-      • Basada en observaciones reales
-      • Validable con métricas
-
-   ⚡ 3. EMPEZAR PEQUEÑO:
-      • Entornos de desarrollo primero
-      • Experimentos simples (Chaos Monkey)
-      • Incrementar gradualmente
-      • Horarios de oficina inicialmente
-
-🔧 EJECUCIÓN:
-
-   📊 4. MONITOREO CONTINUO:
-      • Métricas en tiempo real
-      • Alertas configuradas
-      • Dashboards visibles
-      • Logs centralizados
-
-   🛡️ 5. SAFETY FIRST:
-      • Kill switches disponibles
-      • Blast radius limitado
-      • Dry-run mode disponible
-      • Rollback rápido
-
-   👥 6. COLABORACIÓN:
-      • Involucrar a todos los equipos
-      • Comunicar experimentos
-      • Compartir resultados
-      • Post-mortems sin culpa
-
-📈 ESCALAMIENTO:
-
-   🎮 7. AUTOMATIZACIÓN:
-      • Experimentos programados
-      • Validación automática
-      • Reportes automáticos
-      • Integración CI/CD
-
-   🌍 8. PRODUCCIÓN:
-      • Horarios de bajo tráfico
-      • Monitoreo intensivo
-      • Equipos en standby
-      • Comunicación clara
-
-   📚 9. APRENDIZAJE CONTINUO:
-      • Documentar hallazgos
-      • Mejorar sistemas basado en resultados
-      • Compartir conocimiento
-      • Iterar y mejorar experimentos
-
-❌ QUÉ EVITAR:
-   • Experimentos sin hipótesis
-   • Falta de monitoreo
-   • No tener plan de rollback
-   • Culpar por fallas encontradas
-   • Experimentos en viernes
-        """)
+        print(_TEXT_BEST_PRACTICES)
         self.wait_for_user()
         
     # ═══════════════════════════════════════════════════════════════════
@@ -1958,101 +2325,11 @@ que aparecen ante los usuarios como un sistema único y coherente.
                 "require_confirmation_for_destructive": False,
                 "max_concurrent_experiments": 1  # Solo 1 experimento a la vez
             },
-            "services": {
-                "api-gateway": {
-                    "type": "api-gateway",
-                    "initial_instances": 6,  # MUCHAS INSTANCIAS - para estadísticas claras
-                    "min_instances": 2,      # AGRESIVO - Solo 2 mínimas
-                    "max_instances": 10,
-                    "region": "us-east-1"
-                },
-                "auth-service": {
-                    "type": "auth-service", 
-                    "initial_instances": 5,  # MUCHAS INSTANCIAS - para estadísticas claras
-                    "min_instances": 2,      # AGRESIVO - Permitir bajar a 2
-                    "max_instances": 8,
-                    "region": "us-east-1"
-                },
-                "user-service": {
-                    "type": "user-profile",
-                    "initial_instances": 5,  # MUCHAS INSTANCIAS - para que fallen algunas
-                    "min_instances": 2,      # AGRESIVO - Permitir bajar a 2
-                    "max_instances": 8,
-                    "region": "us-east-1"
-                },
-                "payment-service": {
-                    "type": "database",
-                    "initial_instances": 6,  # MUCHAS INSTANCIAS - servicio crítico
-                    "min_instances": 2,
-                    "max_instances": 9,
-                    "region": "us-east-1"
-                },
-                "notification-service": {
-                    "type": "api-gateway",
-                    "initial_instances": 7,  # MÁS INSTANCIAS - para que muchas fallen
-                    "min_instances": 2,
-                    "max_instances": 10,
-                    "region": "us-east-1"
-                },
-                "analytics-service": {
-                    "type": "cache",
-                    "initial_instances": 5,  # MÁS INSTANCIAS para redundancia
-                    "min_instances": 2,
-                    "max_instances": 8,
-                    "region": "us-east-1"
-                },
-                "file-storage": {
-                    "type": "database",
-                    "initial_instances": 5,  # MÁS INSTANCIAS - para fallos visibles
-                    "min_instances": 1,      # Permitir fallar completamente
-                    "max_instances": 8,
-                    "region": "us-east-1"
-                },
-                "search-service": {
-                    "type": "cache",
-                    "initial_instances": 5,  # MÁS INSTANCIAS para redundancia
-                    "min_instances": 2,
-                    "max_instances": 8,
-                    "region": "us-east-1"
-                },
-                "mobile-api": {
-                    "type": "user-profile",
-                    "initial_instances": 6,  # MUCHAS INSTANCIAS - API crítica
-                    "min_instances": 2,
-                    "max_instances": 9,
-                    "region": "us-east-1"
-                },
-                "security-service": {
-                    "type": "auth-service",
-                    "initial_instances": 4,  # MÁS INSTANCIAS para redundancia
-                    "min_instances": 2,
-                    "max_instances": 7,
-                    "region": "us-east-1"
-                },
-                "monitoring-service": {
-                    "type": "database",
-                    "initial_instances": 4,  # MÁS INSTANCIAS para redundancia
-                    "min_instances": 2,
-                    "max_instances": 7,
-                    "region": "us-east-1"
-                },
-                "database": {
-                    "type": "database",
-                    "initial_instances": 6,  # MUCHAS INSTANCIAS - DB crítica
-                    "min_instances": 3,      # MÍNIMO 3 para DB para estadísticas claras
-                    "max_instances": 9,
-                    "region": "us-east-1"
-                },
-                "cache": {
-                    "type": "cache",
-                    "initial_instances": 5,  # MÁS INSTANCIAS - para fallos claros
-                    "min_instances": 2,      # AGRESIVO - Permitir bajar a 2
-                    "max_instances": 8,
-                    "region": "us-east-1"
-                }
-            }
+            "services": {name: dict(cfg) for name, cfg in _DEMO_SERVICES_TEMPLATE.items()}
         }
         
+        from chaos_system import ChaosEngineeringSystem
+
         system = ChaosEngineeringSystem()
         system.config = demo_config
         return system
@@ -2100,6 +2377,62 @@ que aparecen ante los usuarios como un sistema único y coherente.
             self.system.stop()
             self.running = False
             
+    def _select_service(self, title: str = "Servicios disponibles:") -> Optional[str]:
+        """
+        Lista los servicios numerados y pide uno al usuario. Retorna su nombre,
+        o None (tras avisar) si no hay servicios o la selección no es válida.
+        """
+        services = self._service_names()
+        if not services:
+            print("❌ No hay servicios configurados")
+            self.wait_for_user()
+            return None
+            
+        # Con muchos servicios no se imprime la lista: se escribe el nombre con
+        # autocompletado (TAB) de readline
+        if READLINE_AVAILABLE and len(services) > _COMPLETION_THRESHOLD and sys.stdin.isatty():
+            name = self._prompt_with_completion(f"\n🎯 Servicio ({len(services)} disponibles, TAB completa): ", services)
+            if name in services:
+                return name
+            print("❌ Servicio no encontrado")
+            self.wait_for_user()
+            return None
+            
+        self.print_lines([title] + [f"  {i}. {service}" for i, service in enumerate(services, 1)])
+        
+        choice = _parse_int(self._prompt("\n🎯 Selecciona servicio: "), 1, len(services))
+        if choice is None:
+            print("❌ Opción inválida")
+            self.wait_for_user()
+            return None
+            
+        return services[choice - 1]
+        
+    def _prompt_with_completion(self, message: str, options: tuple) -> str:
+        """Pide un valor con autocompletado por prefijo sobre `options` (restaura el completer previo)"""
+        def complete(text, state):
+            matches = [option for option in options if option.startswith(text)]
+            return matches[state] if state < len(matches) else None
+        
+        previous_completer = readline.get_completer()
+        previous_delims = readline.get_completer_delims()
+        readline.set_completer(complete)
+        readline.set_completer_delims(" \t\n")  # Los nombres llevan guiones
+        # libedit (readline de macOS) usa otra sintaxis para el mismo binding
+        if "libedit" in (readline.__doc__ or ""):
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+        try:
+            return self._prompt(message).strip()
+        finally:
+            readline.set_completer(previous_completer)
+            readline.set_completer_delims(previous_delims)
+        
+    def _service_names(self) -> tuple:
+        """Nombres de los servicios registrados, en orden de registro (tupla inmutable)"""
+        return tuple(self.system.services)
+        
     def cleanup_and_exit(self):
         """Limpia y sale"""
         print("\n🧹 Limpiando y saliendo...")
@@ -2112,22 +2445,64 @@ que aparecen ante los usuarios como un sistema único y coherente.
         print("   🌟 ¡Esperamos que hayas aprendido algo nuevo!")
         
     def clear_screen(self):
-        """Limpia la pantalla"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Limpia la pantalla (con escape ANSI, sin lanzar un proceso `clear`/`cls`)"""
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
         
     def wait_for_user(self, message: str = "Presiona Enter para continuar..."):
         """Espera input del usuario"""
-        input(f"\n{message}")
+        _flush_stdin()
+        self._prompt(f"\n{message}")
+        
+    def _prompt(self, message: str) -> str:
+        """
+        Lee una respuesta del usuario. En terminal usa input() (historial y
+        edición con readline); con stdin redirigido escribe el prompt con un
+        solo flush y lee con sys.stdin.readline, sin los hooks de input().
+        """
+        if sys.stdin.isatty():
+            return input(message)
+        
+        sys.stdout.write(message)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
         
     def confirm(self, message: str) -> bool:
         """Pide confirmación al usuario"""
-        response = input(f"{message} (s/N): ").strip().lower()
-        return response in ['s', 'si', 'y', 'yes']
+        return self._prompt(f"{message} (s/N): ").strip().lower() in _YES_ANSWERS
+        
+    def print_lines(self, lines):
+        """Escribe un bloque de líneas con una sola escritura y un solo flush"""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        
+    def redraw_frame(self, lines: List[str], previous: List[str]):
+        """
+        Redibuja un frame de pantalla completa escribiendo solo las líneas que
+        cambiaron respecto al anterior (posicionando el cursor con escapes ANSI),
+        en lugar de limpiar y reimprimir todo: sin parpadeo y con menos bytes.
+        """
+        output = []
+        for row, line in enumerate(lines, 1):
+            if row > len(previous) or previous[row - 1] != line:
+                output.append(f"\x1b[{row};1H{line}\x1b[K")
+        
+        # Si el frame se acortó (p. ej. se eliminó un servicio), borrar el resto
+        if len(lines) < len(previous):
+            output.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+        
+        output.append(f"\x1b[{len(lines) + 1};1H")  # Cursor debajo del frame
+        _write_raw("".join(output))
         
     def print_error(self, message: str):
-        """Muestra mensaje de error"""
-        print(f"\n{message}")
-        time.sleep(1.5)
+        """
+        Registra un mensaje de error para mostrarlo al redibujar el menú principal
+        (todos los menús vuelven a él), en lugar de bloquear con una pausa.
+        """
+        self._pending_error = message
 
 # ═══════════════════════════════════════════════════════════════════
 # PUNTO DE ENTRADA PRINCIPAL
@@ -3,14 +3,95 @@
 Script para ejecutar todos los tests del simulador de Chaos Engineering
 """
 
+import functools
+import importlib
+import re
 import unittest
 import sys
 import os
 
+# No escribir .pyc durante las ejecuciones de tests (equivale a PYTHONDONTWRITEBYTECODE=1)
+sys.dont_write_bytecode = True
+os.environ.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+
+# Directorio de tests y raíz del proyecto (calculados una sola vez)
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(TESTS_DIR)
+
 # Agregar el directorio del proyecto al path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+# Loader compartido y mtimes de los módulos ya cargados, para que llamadas
+# repetidas (modo watch, reintentos) solo recarguen módulos modificados
+_LOADER = unittest.TestLoader()
+_MTIME_CACHE = {}
+
+# Patrón de archivos de test precompilado (equivalente a 'test_*.py' sin fnmatch)
+_TEST_FILE_RE = re.compile(r"test_.*\.py$")
+
+TEST_DESCRIPTIONS = {
+    "test_service.py": "Tests para servicios e instancias",
+    "test_chaos_monkey.py": "Tests para Chaos Monkey",
+    "test_integration.py": "Tests de integración del sistema",
+    "test_reports.py": "Tests para el generador de reportes"
+}
+
+@functools.lru_cache(maxsize=1)
+def _discover_test_files(start_dir: str) -> tuple:
+    """
+    Lista los archivos test_*.py del directorio con un único os.scandir.
+    El resultado se cachea para que show_available_tests y run_all_tests
+    compartan el mismo escaneo.
+    """
+    try:
+        return tuple(sorted(
+            entry.name for entry in os.scandir(start_dir)
+            if _TEST_FILE_RE.match(entry.name) and entry.is_file()
+        ))
+    except OSError:
+        return ()
+
+def _xdist_available() -> bool:
+    """Indica si pytest y pytest-xdist están instalados (dependencias opcionales)"""
+    try:
+        import pytest  # noqa: F401
+        import xdist  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def _forked_available() -> bool:
+    """Indica si pytest-forked está instalado (dependencia opcional, solo POSIX)"""
+    if not hasattr(os, "fork"):
+        return False
+    try:
+        import pytest_forked  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def run_all_tests_parallel():
+    """
+    Ejecuta todos los tests en paralelo con pytest-xdist.
+    
+    Usa --dist=loadfile para que cada archivo quede en un único worker: los
+    tests de integración comparten estado pesado dentro del mismo archivo.
+    """
+    import pytest
+    
+    start_dir = TESTS_DIR
+    print(f"⚡ Ejecutando tests en paralelo con pytest-xdist en: {start_dir}")
+    
+    args = [start_dir, "-n", "auto", "--dist=loadfile", "-q"]
+    
+    # Con pytest-forked cada test corre en un subproceso propio, así los hilos
+    # daemon que dejan los servicios no se acumulan entre tests
+    if _forked_available():
+        args.append("--forked")
+    
+    exit_code = pytest.main(args)
+    return 0 if exit_code == 0 else 1
+
 def run_all_tests():
     """Ejecuta todos los tests disponibles"""
     
@@ -23,11 +104,13 @@ def run_all_tests():
     logging.basicConfig(level=logging.ERROR)
     
     # Descubrir y cargar todos los tests
-    loader = unittest.TestLoader()
-    start_dir = os.path.dirname(os.path.abspath(__file__))
+    start_dir = TESTS_DIR
+    if start_dir not in sys.path:
+        sys.path.insert(0, start_dir)
     
-    # Cargar todos los tests que comienzan con 'test_'
-    test_suite = loader.discover(start_dir, pattern='test_*.py')
+    # Cargar todos los tests que comienzan con 'test_' (escaneo compartido y cacheado)
+    module_names = [filename[:-3] for filename in _discover_test_files(start_dir)]
+    test_suite = _LOADER.loadTestsFromNames(module_names)
     
     # Configurar el runner con verbosidad
     runner = unittest.TextTestRunner(
@@ -87,6 +170,29 @@ def run_all_tests():
     # Retornar código de salida apropiado
     return 0 if (failures == 0 and errors == 0) else 1
 
+def _reload_if_modified(module_name):
+    """
+    Recarga un módulo de tests ya importado solo si su archivo cambió.
+    
+    module_name puede ser un módulo (tests.test_service) o apuntar a una clase
+    o método dentro de él (test_service.TestService). Solo se considera el
+    módulo test_* de la ruta; paquetes y otros módulos nunca se recargan.
+    """
+    parts = module_name.split('.')
+    test_parts = [i for i, part in enumerate(parts) if part.startswith('test_')]
+    if not test_parts:
+        return
+    module = sys.modules.get('.'.join(parts[:test_parts[0] + 1]))
+    module_file = getattr(module, '__file__', None)
+    if not module_file:
+        return
+    
+    mtime = os.path.getmtime(module_file)
+    cached_mtime = _MTIME_CACHE.get(module_file)
+    if cached_mtime is not None and cached_mtime != mtime:
+        importlib.reload(module)
+    _MTIME_CACHE[module_file] = mtime
+
 def run_specific_test_module(module_name):
     """Ejecuta tests de un módulo específico"""
     
@@ -97,11 +203,10 @@ def run_specific_test_module(module_name):
     import logging
     logging.basicConfig(level=logging.ERROR)
     
-    # Cargar el módulo específico
-    loader = unittest.TestLoader()
-    
     try:
-        test_suite = loader.loadTestsFromName(module_name)
+        _reload_if_modified(module_name)
+        test_suite = _LOADER.loadTestsFromName(module_name)
+        _reload_if_modified(module_name)  # Registra el mtime tras la primera importación
         runner = unittest.TextTestRunner(verbosity=2)
         result = runner.run(test_suite)
         
@@ -123,19 +228,18 @@ def show_available_tests():
     print("📋 TESTS DISPONIBLES:")
     print("="*50)
     
-    test_files = [
-        ("test_service.py", "Tests para servicios e instancias"),
-        ("test_chaos_monkey.py", "Tests para Chaos Monkey"),
-        ("test_integration.py", "Tests de integración del sistema")
-    ]
+    # Archivos esperados y cualquier test_*.py adicional encontrado en el directorio
+    discovered = _discover_test_files(TESTS_DIR)
+    test_files = list(TEST_DESCRIPTIONS) + [f for f in discovered if f not in TEST_DESCRIPTIONS]
     
-    for filename, description in test_files:
-        filepath = os.path.join(os.path.dirname(__file__), filename)
-        status = "✅" if os.path.exists(filepath) else "❌"
+    for filename in test_files:
+        description = TEST_DESCRIPTIONS.get(filename, "")
+        status = "✅" if filename in discovered else "❌"
         print(f"  {status} {filename:<20} - {description}")
     
     print("\nUso:")
     print("  python run_tests.py                    # Ejecutar todos los tests")
+    print("  python run_tests.py --parallel         # Ejecutar todos en paralelo (pytest-xdist)")
     print("  python run_tests.py test_service       # Ejecutar tests específicos")
     print("  python run_tests.py --list             # Mostrar tests disponibles")
 
@@ -147,6 +251,14 @@ if __name__ == "__main__":
         if arg in ["--list", "-l", "list"]:
             show_available_tests()
             sys.exit(0)
+        elif arg in ["--parallel", "-p"]:
+            # Modo paralelo opcional: requiere pytest y pytest-xdist
+            if _xdist_available():
+                exit_code = run_all_tests_parallel()
+            else:
+                print("⚠️  pytest-xdist no está instalado, ejecutando los tests en serie")
+                exit_code = run_all_tests()
+            sys.exit(exit_code)
         else:
             # Ejecutar módulo específico
             exit_code = run_specific_test_module(arg)
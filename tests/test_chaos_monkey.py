@@ -13,19 +13,29 @@ import os
 # Agregar el directorio padre al path para importar módulos
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from chaos.chaos_monkey import ChaosMonkey
 from core.service import Service, ServiceType
 
 class TestChaosMonkey(unittest.TestCase):
     """Tests para la clase ChaosMonkey"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Importa ChaosMonkey al ejecutar la clase"""
+        # Importación diferida: el módulo de tests se puede importar/listar sin
+        # cargar chaos.chaos_monkey hasta que la clase realmente se ejecuta
+        from chaos.chaos_monkey import ChaosMonkey
+        cls.ChaosMonkey = ChaosMonkey
+    
     def setUp(self):
         """Configuración antes de cada test"""
-        self.chaos_monkey = ChaosMonkey("test-monkey")
-        
-        # Crear servicios mock para pruebas
-        self.test_service = Service("test-service", ServiceType.API_GATEWAY, initial_instances=3)
-        self.db_service = Service("database", ServiceType.DATABASE, initial_instances=2)
+        self.chaos_monkey = self.ChaosMonkey("test-monkey")
+        
+        # Servicios nuevos por test y sin hilo de health checks (su primer
+        # ciclo de auto-scaling correría en paralelo con el test)
+        self.test_service = Service("test-service", ServiceType.API_GATEWAY, initial_instances=3,
+                                    start_health_checks=False)
+        self.db_service = Service("database", ServiceType.DATABASE, initial_instances=2,
+                                  start_health_checks=False)
         
         # Registrar servicios
         self.chaos_monkey.register_service("test-service", self.test_service)
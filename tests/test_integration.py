@@ -3,7 +3,6 @@ Tests de integración para el sistema completo de Chaos Engineering
 """
 
 import unittest
-import time
 import tempfile
 import os
 import sys
@@ -69,7 +68,8 @@ class TestChaosEngineeringSystemIntegration(unittest.TestCase):
         with self.system:
             # Simular tráfico por poco tiempo usando load balancer
             if self.system.load_balancer:
-                self.system.load_balancer.simulate_traffic(requests_per_second=10, duration_seconds=5)
+                # Duración corta: el generador corre en un hilo daemon y no hace falta más
+                self.system.load_balancer.simulate_traffic(requests_per_second=10, duration_seconds=1)
             
             # Verificar que el servicio existe y está funcionando
             service = self.system.services["api-service"]
@@ -113,8 +113,8 @@ class TestChaosEngineeringSystemIntegration(unittest.TestCase):
         with self.system:
             # Simular algo de actividad directamente con el servicio
             service = self.system.services["monitored-service"]
-            for _ in range(10):
-                service.handle_request()
+            responses = service.handle_requests(10)
+            self.assertEqual(len(responses), 10, "Ninguna request simulada debería fallar")
             
             # Verificar que el monitoreo funciona
             if self.system.monitoring:
@@ -137,15 +137,16 @@ class TestChaosEngineeringSystemIntegration(unittest.TestCase):
             # Verificar que el servicio está registrado
             self.assertIn("balanced-service", self.system.load_balancer.services)
             
-            # Simular distribución de carga
-            instances_selected = []
+            # Simular distribución de carga: basta con ver dos instancias distintas
+            unique_instances = set()
             for _ in range(10):
-                instance = self.system.load_balancer.route_request("balanced-service")
-                if instance:
-                    instances_selected.append(instance.instance_id)
+                response = self.system.load_balancer.route_request("balanced-service")
+                if response:
+                    unique_instances.add(response["instance_id"])
+                if len(unique_instances) > 1:
+                    break
             
             # Verificar que se distribuyó entre múltiples instancias
-            unique_instances = set(instances_selected)
             self.assertGreater(len(unique_instances), 1)
     
     def test_report_generation(self):
@@ -156,8 +157,8 @@ class TestChaosEngineeringSystemIntegration(unittest.TestCase):
         with self.system:
             # Simular alguna actividad directamente con el servicio
             service = self.system.services["report-service"]
-            for _ in range(10):
-                service.handle_request()
+            responses = service.handle_requests(10)
+            self.assertEqual(len(responses), 10, "Ninguna request simulada debería fallar")
             
             # Ejecutar experimento si es posible
             if self.system.chaos_monkey:
@@ -191,21 +192,17 @@ class TestChaosEngineeringSystemIntegration(unittest.TestCase):
             
             # Simular tráfico base directamente con el servicio (con manejo de errores)
             service = self.system.services["resilient-service"] 
-            for _ in range(20):
-                try:
-                    service.handle_request()
-                except Exception:
-                    # Ignorar errores simulados durante el test
-                    pass
+            # handle_requests cuenta los errores simulados en vez de lanzarlos
+            service.handle_requests(20)
             
             # Introducir múltiples fallas
             failures_introduced = 0
             if self.system.chaos_monkey:
                 for _ in range(3):  # Intentar 3 fallas
                     result = self.system.chaos_monkey.force_chaos("resilient-service")
+                    # force_chaos es síncrono: no hace falta pausar entre fallas
                     if result["status"] == "success":
                         failures_introduced += 1
-                    time.sleep(1)  # Pausa entre fallas
             
             # Verificar que el sistema sigue funcionando
             remaining_healthy = len(self.system.services["resilient-service"].get_healthy_instances())
@@ -0,0 +1,287 @@
+"""
+Tests unitarios para el módulo utils.reports
+"""
+
+import gzip
+import unittest
+from unittest import mock
+import tempfile
+import shutil
+import sys
+import os
+import time
+
+# Agregar el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.reports
+from utils.reports import ReportGenerator
+
+class _FakeService:
+    """Servicio mínimo con métricas fijas"""
+    
+    def __init__(self, metrics):
+        self.metrics = metrics
+    
+    def get_service_metrics(self):
+        return dict(self.metrics)
+
+class _FakeMonitoring:
+    """Monitoreo mínimo cuyos timestamps cambian en cada lectura, como el real"""
+    
+    def __init__(self, alerts):
+        self.alerts = alerts
+    
+    def get_dashboard_data(self):
+        return {"last_update": time.time()}
+    
+    def generate_health_report(self):
+        return {"timestamp": time.time()}
+    
+    def get_alerts(self, active_only=True):
+        return [dict(alert) for alert in self.alerts]
+
+class _FakeExperimentRunner:
+    """Runner mínimo con estadísticas e historial de experimentos"""
+    
+    def __init__(self, statistics):
+        self.statistics = statistics
+        self.history = []
+    
+    def get_all_experiments_status(self):
+        return {"statistics": dict(self.statistics),
+                "experiment_history": [dict(experiment) for experiment in self.history]}
+
+class _FakeSystem:
+    """Sistema mínimo con servicios, monitoreo y experimentos"""
+    
+    def __init__(self, services, alerts=(), statistics=None):
+        self.services = {name: _FakeService(metrics) for name, metrics in services.items()}
+        self.monitoring = _FakeMonitoring(list(alerts))
+        self.experiment_runner = _FakeExperimentRunner(statistics or {})
+    
+    def get_system_status(self):
+        return {"uptime_seconds": time.time()}
+
+def sample_report_data():
+    """Datos de reporte con un servicio sano, uno crítico y uno degradado"""
+    return {
+        "timestamp": 0,
+        "services": {
+            "api": {"availability": 95.0, "total_instances": 3, "healthy_instances": 3,
+                    "avg_response_time_ms": 12.0, "error_rate": 0.5, "total_requests": 100},
+            "db": {"availability": 40.0, "total_instances": 1, "healthy_instances": 0,
+                   "avg_response_time_ms": 80.0, "error_rate": 30.0, "total_requests": 50},
+            "cache": {"availability": 75.0, "total_instances": 2, "healthy_instances": 1,
+                      "avg_response_time_ms": 3.0, "error_rate": 5.0, "total_requests": 70},
+        },
+        "monitoring": {"active_alerts": [{"severity": "CRITICAL"}, {"severity": "HIGH"}]},
+        "experiments": {"statistics": {"success_rate": 60, "total_experiments": 4}},
+    }
+
+class TestReportGenerator(unittest.TestCase):
+    """Tests para el análisis de ReportGenerator"""
+    
+    def setUp(self):
+        """Configuración antes de cada test"""
+        self.output_dir = tempfile.mkdtemp()
+        self.generator = ReportGenerator(self.output_dir)
+        self.report_data = sample_report_data()
+    
+    def tearDown(self):
+        """Limpieza después de cada test"""
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+    
+    def test_service_columns(self):
+        """Test de la vista por columnas de los servicios"""
+        columns = self.generator._service_columns(self.report_data["services"])
+        
+        self.assertEqual(columns["names"], ("api", "db", "cache"))
+        self.assertEqual(columns["availability"], (95.0, 40.0, 75.0))
+        self.assertEqual(columns["total_instances"], (3, 1, 2))
+        self.assertEqual(columns["healthy_instances"], (3, 0, 1))
+    
+    def test_analysis(self):
+        """Test de resumen, recomendaciones y riesgos"""
+        analysis = self.generator._generate_analysis(self.report_data)
+        
+        self.assertAlmostEqual(analysis["summary"]["average_availability"], 70.0)
+        self.assertEqual(analysis["summary"]["critical_alerts"], 1)
+        self.assertEqual(analysis["summary"]["alerts_by_severity"], {"CRITICAL": 1, "HIGH": 1})
+        self.assertEqual(len(analysis["weaknesses"]), 1)
+        self.assertTrue(0 <= analysis["resilience_score"] <= 100)
+        
+        recommendations = " ".join(analysis["recommendations"])
+        self.assertIn("db, cache", recommendations)
+        self.assertIn("instancia única: db", recommendations)
+        
+        risks = analysis["risk_assessment"]
+        self.assertEqual(risks["overall_risk_level"], "HIGH")
+        self.assertEqual(len(risks["high_risk"]), 1)
+    
+    def test_severity_counts(self):
+        """Test de conteo de alertas por severidad"""
+        alerts = [{"severity": "CRITICAL"}, {"severity": "HIGH"}, {"severity": "CRITICAL"}, {}]
+        counts = self.generator._severity_counts(alerts)
+        
+        self.assertEqual(counts["CRITICAL"], 2)
+        self.assertEqual(counts["HIGH"], 1)
+        self.assertEqual(counts["UNKNOWN"], 1)
+    
+    def test_html_report_file(self):
+        """Test del HTML escrito a disco contra fragmentos fijos del reporte"""
+        self.report_data["analysis"] = self.generator._generate_analysis(self.report_data)
+        filepath = self.generator._generate_html_report(self.report_data, {}, "test")
+        
+        with open(filepath, encoding="utf-8") as f:
+            content = f.read()
+        
+        self.assertTrue(content.startswith('\n<!DOCTYPE html>\n<html lang="es">\n<head>\n'))
+        self.assertTrue(content.endswith("</table></div>\n</body>\n</html>\n"))
+        self.assertIn(
+            '<div class="metric">\n'
+            '            <div class="score medium">71.7</div>\n'
+            '            <div>Resilience Score</div>\n'
+            '        </div>\n'
+            '        <div class="metric">\n'
+            '            <div style="font-size: 24px;">70.0%</div>\n'
+            '            <div>Disponibilidad Promedio</div>\n',
+            content
+        )
+        self.assertIn('<div style="font-size: 24px;">4</div>\n            <div>Experimentos Ejecutados</div>', content)
+        self.assertIn('<div style="font-size: 24px;">2</div>\n            <div>Alertas Activas</div>', content)
+        self.assertIn(
+            "\n            <tr>\n"
+            "                <td>db</td>\n"
+            "                <td>40.0%</td>\n"
+            "                <td>0/1</td>\n"
+            "                <td>80.0ms</td>\n"
+            "                <td>30.00%</td>\n"
+            "            </tr>\n            ",
+            content
+        )
+        self.assertEqual(os.listdir(self.output_dir), [os.path.basename(filepath)])
+    
+    def test_html_report_failure_leaves_no_file(self):
+        """Test de que un error a mitad del HTML no deja archivos a medias"""
+        self.report_data["analysis"] = self.generator._generate_analysis(self.report_data)
+        
+        with mock.patch.object(self.generator, "_html_services_section", side_effect=RuntimeError("fallo")):
+            with self.assertRaises(RuntimeError):
+                self.generator._generate_html_report(self.report_data, {}, "test")
+        
+        self.assertEqual(os.listdir(self.output_dir), [])
+    
+    def test_compressed_html_report(self):
+        """Test del reporte HTML comprimido con gzip"""
+        generator = ReportGenerator(self.output_dir, compress_html=True)
+        self.report_data["analysis"] = generator._generate_analysis(self.report_data)
+        filepath = generator._generate_html_report(self.report_data, {}, "test")
+        
+        self.assertTrue(filepath.endswith(".html.gz"))
+        with gzip.open(filepath, "rt", encoding="utf-8") as f:
+            self.assertEqual(f.read(), generator._create_html_template(self.report_data, {}))
+    
+    def test_svg_availability_chart(self):
+        """Test de la gráfica de disponibilidad en SVG inline"""
+        chart = self.generator._create_availability_chart(self.report_data)
+        
+        self.assertTrue(chart.startswith("<svg"))
+        self.assertEqual(chart.count("<rect"), 3)
+        self.assertEqual(chart.count('fill="green"'), 1)
+        self.assertEqual(chart.count('fill="red"'), 2)
+        self.assertIn(">cache</text>", chart)
+    
+    def test_svg_chart_long_service_names(self):
+        """Test de etiquetas giradas y recortadas con nombres de servicio largos"""
+        names = ("notification-service", "monitoring-service", "payment-service", "x" * 40)
+        chart = self.generator._svg_bar(names, (99.0, 92.0, 50.0, 10.0), title="Disponibilidad")
+        
+        self.assertEqual(chart.count('transform="rotate(-45 '), 4)
+        self.assertIn("<title>notification-service</title>notification-service</text>", chart)
+        self.assertIn("<title>" + "x" * 40 + "</title>" + "x" * 29 + "…</text>", chart)
+        
+        # El alto deja sitio a la etiqueta girada más larga (30 caracteres)
+        height = int(chart.split('height="', 1)[1].split('"', 1)[0])
+        self.assertGreater(height, 40 + 200 + 30 * 7 * 0.7)
+        
+        # La etiqueta de la primera barra no se sale por la izquierda
+        first_x = float(chart.split('text-anchor="end" transform="rotate(-45 ', 1)[1].split(" ", 1)[0])
+        self.assertGreaterEqual(first_x, 30 * 7 * 0.7)
+    
+    def test_csv_reports(self):
+        """Test de los reportes CSV de servicios y experimentos"""
+        self.report_data["experiments"]["experiment_history"] = [{"name": "exp-1", "runtime_seconds": 2.5}]
+        files = self.generator._generate_csv_reports(self.report_data, "test")
+        self.assertEqual(len(files), 2)
+        
+        with open(files[0], encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[2], "db,40.0,1,0,80.0,30.0,50")
+        
+        with open(files[1], encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[1], "exp-1,,,,2.5,,,")
+    
+    @mock.patch.object(utils.reports, "_REPORT_CACHE_MIN_SECONDS", 0)
+    def test_report_cache(self):
+        """Test de reutilización del HTML mientras el estado que muestra no cambia"""
+        system = _FakeSystem(self.report_data["services"], [{"id": "a1", "severity": "CRITICAL"}],
+                             self.report_data["experiments"]["statistics"])
+        formats = ["html", "json", "csv"]
+        first = self.generator.generate_comprehensive_report(system, include_charts=False, formats=formats)
+        
+        # Los relojes del monitoreo y del sistema avanzan, pero el estado no cambia
+        with mock.patch.object(self.generator, "_generate_html_report") as html_report:
+            files = self.generator.generate_comprehensive_report(system, include_charts=False, formats=formats)
+            html_report.assert_not_called()
+        self.assertEqual(files["html"], first["html"])
+        
+        # JSON y CSV se escriben siempre: un experimento nuevo en el historial
+        # aparece en ellos aunque el HTML se reutilice
+        system.experiment_runner.history.append({"name": "exp-nuevo", "runtime_seconds": 1.5})
+        files = self.generator.generate_comprehensive_report(system, include_charts=False, formats=formats)
+        self.assertEqual(files["html"], first["html"])
+        with open(files["json"], encoding="utf-8") as f:
+            self.assertIn("exp-nuevo", f.read())
+        with open(files["csv"][1], encoding="utf-8") as f:
+            self.assertIn("exp-nuevo,", f.read())
+        
+        # Un cambio de estado invalida la huella
+        system.services["db"].metrics["availability"] = 99.0
+        self.generator.generate_comprehensive_report(system, include_charts=False, formats=formats)
+        self.assertEqual(len(self.generator._report_cache), 2)
+        
+        # Una alerta nueva también
+        system.monitoring.alerts.append({"id": "a2", "severity": "HIGH"})
+        self.generator.generate_comprehensive_report(system, include_charts=False, formats=formats)
+        self.assertEqual(len(self.generator._report_cache), 3)
+        
+        # Cambiar la compresión del HTML no reutiliza la ruta .html anterior
+        self.generator.compress_html = True
+        files = self.generator.generate_comprehensive_report(system, include_charts=False)
+        self.assertTrue(files["html"].endswith(".html.gz"))
+    
+    def test_output_directory_recreated(self):
+        """Test de que un generador nuevo recrea el directorio si se borró"""
+        shutil.rmtree(self.output_dir)
+        generator = ReportGenerator(self.output_dir)
+        
+        files = generator._generate_csv_reports(self.report_data, "test")
+        self.assertTrue(os.path.exists(files[0]))
+    
+    def test_analysis_without_services(self):
+        """Test de análisis sin servicios registrados"""
+        analysis = self.generator._generate_analysis({"services": {}})
+        
+        self.assertEqual(analysis["summary"]["average_availability"], 0)
+        self.assertEqual(analysis["risk_assessment"]["overall_risk_level"], "LOW")
+
+if __name__ == "__main__":
+    # Configurar logging para tests
+    import logging
+    logging.basicConfig(level=logging.WARNING)  # Reducir logs durante tests
+
+    # Ejecutar tests
+    unittest.main(verbosity=2)
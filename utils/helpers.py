@@ -3,14 +3,15 @@ Utilidades simplificadas para el simulador de Chaos Engineering.
 Solo contiene las funciones esenciales sin duplicación.
 """
 
-import json
-import yaml
+import functools
 import time
 import logging
 from typing import Dict, Any, List
-from datetime import datetime, timedelta
 import os
 
+# Última configuración aplicada por setup_logging (para no reconfigurar en cada llamada)
+_LOGGING_CONFIGURED = None
+
 def setup_logging(log_level: str = "INFO", log_file: str = None, colors: bool = True) -> logging.Logger:
     """
     Configura el sistema de logging simplificado.
@@ -19,8 +20,17 @@ def setup_logging(log_level: str = "INFO", log_file: str = None, colors: bool =
         log_level: Nivel de logging (DEBUG, INFO, WARNING, ERROR)
         log_file: Archivo opcional para logging
         colors: Si True, usa colores en la consola
+    
+    Es idempotente: si se llama de nuevo con los mismos argumentos (p. ej. al
+    crear varias demos en el mismo proceso) no vuelve a crear los handlers.
     """
+    global _LOGGING_CONFIGURED
+    
     logger = logging.getLogger()
+    requested_config = (log_level.upper(), log_file, colors)
+    if _LOGGING_CONFIGURED == requested_config and logger.handlers:
+        return logger
+    
     logger.setLevel(getattr(logging, log_level.upper()))
     
     # Limpiar handlers existentes
@@ -63,18 +73,47 @@ def setup_logging(log_level: str = "INFO", log_file: str = None, colors: bool =
         file_handler.setFormatter(file_formatter)
         logger.addHandler(file_handler)
     
+    _LOGGING_CONFIGURED = requested_config
     return logger
 
+@functools.lru_cache(maxsize=1)
+def _config_parsers():
+    """
+    Importa los parsers de configuración la primera vez que se cargan archivos,
+    para que importar utils.helpers (p. ej. solo para el logging) no pague yaml/json.
+    Retorna (yaml_load, json_loads) usando las implementaciones en C si existen.
+    """
+    import yaml
+    
+    # Loader YAML en C (LibYAML) si está disponible
+    try:
+        from yaml import CSafeLoader as yaml_loader
+    except ImportError:
+        from yaml import SafeLoader as yaml_loader
+    
+    # orjson es opcional: más rápido que json y parsea directamente desde bytes
+    try:
+        import orjson
+        json_loads = orjson.loads
+    except ImportError:
+        import json
+        json_loads = json.loads
+    
+    return functools.partial(yaml.load, Loader=yaml_loader), json_loads
+
 def load_config(config_path: str) -> Dict[str, Any]:
     """Carga configuración desde archivo YAML o JSON."""
+    extension = os.path.splitext(config_path)[1].lower()
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            if config_path.endswith(('.yaml', '.yml')):
-                return yaml.safe_load(f)
-            elif config_path.endswith('.json'):
-                return json.load(f)
-            else:
-                raise ValueError("Formato no soportado. Use .yaml, .yml o .json")
+        yaml_load, json_loads = _config_parsers()
+        if extension in ('.yaml', '.yml'):
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml_load(f)
+        elif extension == '.json':
+            with open(config_path, 'rb') as f:
+                return json_loads(f.read())
+        else:
+            raise ValueError("Formato no soportado. Use .yaml, .yml o .json")
     except FileNotFoundError:
         raise FileNotFoundError(f"Archivo no encontrado: {config_path}")
     except Exception as e:
@@ -84,7 +123,7 @@ def format_timestamp(timestamp: float = None) -> str:
     """Formatea un timestamp a string legible."""
     if timestamp is None:
         timestamp = time.time()
-    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
 
 def format_duration(seconds: float) -> str:
     """Formatea una duración en segundos a string legible."""
@@ -99,10 +138,12 @@ def format_duration(seconds: float) -> str:
 
 def generate_unique_id(prefix: str = "") -> str:
     """Genera un ID único con prefijo opcional."""
-    import uuid
-    unique_id = str(uuid.uuid4())[:8]
+    # 4 bytes aleatorios = 8 caracteres hex, sin construir un objeto UUID
+    unique_id = os.urandom(4).hex()
     return f"{prefix}-{unique_id}" if prefix else unique_id
 
+_ANSI_RESET = '\033[0m'
+
 class ColoredFormatter(logging.Formatter):
     """Formatter que añade colores a los logs."""
     
@@ -112,14 +153,23 @@ class ColoredFormatter(logging.Formatter):
         'WARNING': '\033[33m',  # Amarillo
         'ERROR': '\033[31m',    # Rojo
         'CRITICAL': '\033[91m', # Rojo brillante
-        'RESET': '\033[0m'      # Reset
+        'RESET': _ANSI_RESET    # Reset
+    }
+    
+    # Nombres de nivel ya coloreados, calculados una sola vez
+    COLORED_LEVELS = {
+        level: f"{color}{level}{_ANSI_RESET}"
+        for level, color in COLORS.items() if level != 'RESET'
     }
     
     def format(self, record):
-        # Añadir color al nivel de log
-        level_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        record.levelname = f"{level_color}{record.levelname}{self.COLORS['RESET']}"
-        return super().format(record)
+        # Añadir color al nivel de log sin dejar modificado el record compartido
+        original_levelname = record.levelname
+        record.levelname = self.COLORED_LEVELS.get(original_levelname, original_levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original_levelname
 
 # Función de compatibilidad
 def setup_colored_logging(log_level: str = "INFO") -> logging.Logger:
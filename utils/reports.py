@@ -3,39 +3,215 @@ Generador de reportes para el simulador de Chaos Engineering.
 Crea reportes en HTML, JSON y CSV con métricas y análisis.
 """
 
+import hashlib
+import html
+import importlib.util
+import io
 import json
+import math
 import csv
+import functools
+import gzip
 import time
 import os
-from typing import Dict, List, Any
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, TextIO
 from datetime import datetime
 import logging
+from collections import Counter, OrderedDict
+from operator import itemgetter, methodcaller
 
+# Plotly es opcional y su import es costoso: al cargar el módulo solo se
+# comprueba que esté instalado; se importa la primera vez que se dibuja una gráfica
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+
+# orjson es opcional: serializa el reporte JSON en C; si no está, se usa json
 try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-    from plotly.subplots import make_subplots
-    PLOTLY_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PLOTLY_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Cabecera fija del reporte HTML (estilos incluidos); se emite tal cual, sin formatear
+_HTML_HEAD = """
+<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Reporte de Chaos Engineering</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
+        .header { background-color: #2c3e50; color: white; padding: 20px; border-radius: 8px; }
+        .section { background-color: white; margin: 20px 0; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .metric { display: inline-block; margin: 10px; padding: 15px; background-color: #ecf0f1; border-radius: 5px; }
+        .score { font-size: 48px; font-weight: bold; color: #e74c3c; }
+        .score.good { color: #27ae60; }
+        .score.medium { color: #f39c12; }
+        .recommendation { background-color: #e8f5e9; border-left: 4px solid #4caf50; padding: 10px; margin: 5px 0; }
+        .weakness { background-color: #ffebee; border-left: 4px solid #f44336; padding: 10px; margin: 5px 0; }
+        .strength { background-color: #e3f2fd; border-left: 4px solid #2196f3; padding: 10px; margin: 5px 0; }
+        .risk-high { color: #f44336; font-weight: bold; }
+        .risk-medium { color: #ff9800; font-weight: bold; }
+        .risk-low { color: #4caf50; font-weight: bold; }
+        table { width: 100%; border-collapse: collapse; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+"""
+
+# Resumen ejecutivo: se rellena con str.format_map
+_HTML_SUMMARY_TEMPLATE = """    <div class="header">
+        <h1>🔥 Reporte de Chaos Engineering</h1>
+        <p>Generado el: {generated_at}</p>
+    </div>
+    <div class="section">
+        <h2>📊 Resumen Ejecutivo</h2>
+        <div class="metric">
+            <div class="score {score_class}">{resilience_score:.1f}</div>
+            <div>Resilience Score</div>
+        </div>
+        <div class="metric">
+            <div style="font-size: 24px;">{average_availability:.1f}%</div>
+            <div>Disponibilidad Promedio</div>
+        </div>
+        <div class="metric">
+            <div style="font-size: 24px;">{total_experiments}</div>
+            <div>Experimentos Ejecutados</div>
+        </div>
+        <div class="metric">
+            <div style="font-size: 24px;">{active_alerts}</div>
+            <div>Alertas Activas</div>
+        </div>
+    </div>
+"""
+
+# Fila de la tabla de servicios (campos posicionales: nombre y luego
+# _SERVICE_ROW_FIELDS en orden) y (clave, valor por defecto) de cada campo
+_SERVICE_ROW_TEMPLATE = """
+            <tr>
+                <td>{}</td>
+                <td>{:.1f}%</td>
+                <td>{}/{}</td>
+                <td>{:.1f}ms</td>
+                <td>{:.2f}%</td>
+            </tr>
+            """
+
+_SERVICE_ROW_FIELDS = (
+    ("availability", 0),
+    ("healthy_instances", 0),
+    ("total_instances", 0),
+    ("avg_response_time_ms", 0),
+    ("error_rate", 0)
+)
+
+# Columnas de los reportes CSV: (clave en los datos, valor por defecto)
+_SERVICES_CSV_HEADER = ('Servicio', 'Disponibilidad', 'Instancias_Totales', 'Instancias_Saludables',
+                        'Tiempo_Respuesta_ms', 'Tasa_Error_pct', 'Total_Requests')
+_SERVICES_CSV_FIELDS = (
+    ('availability', 0),
+    ('total_instances', 0),
+    ('healthy_instances', 0),
+    ('avg_response_time_ms', 0),
+    ('error_rate', 0),
+    ('total_requests', 0)
+)
+
+_EXPERIMENTS_CSV_HEADER = ('Nombre', 'Tipo', 'Estado', 'Servicio_Target', 'Duración_s',
+                           'Tiempo_Inicio', 'Tiempo_Fin', 'Mensaje_Error')
+_EXPERIMENTS_CSV_FIELDS = (
+    ('name', ''),
+    ('type', ''),
+    ('status', ''),
+    ('target_service', ''),
+    ('runtime_seconds', 0),
+    ('started_at', ''),
+    ('completed_at', ''),
+    ('error_message', '')
+)
+
+# Hasta este número de barras la gráfica de disponibilidad se dibuja como SVG
+# inline; por encima se usa Plotly (si está instalado) por su zoom y tooltips
+_SVG_MAX_POINTS = 50
+_SVG_BAR_WIDTH = 40
+_SVG_BAR_GAP = 20
+_SVG_PLOT_HEIGHT = 200
+_SVG_LABEL_MAX_CHARS = 30
+_SVG_CHAR_WIDTH = 7  # Ancho medio aproximado de un carácter a 12px
+
+# Severidad de una alerta (asdict de core.monitoring.Alert)
+_SEVERITY_KEY = itemgetter("severity")
+
+# Reportes HTML cacheados por huella del estado que muestran. Solo se cachean
+# los reportes cuya generación costó más que el umbral (abaratar lo barato no compensa)
+_REPORT_CACHE_SIZE = 4
+_REPORT_CACHE_MIN_SECONDS = 0.01
+
+# Métricas de servicio que entran en la huella (las que muestra el HTML)
+_FINGERPRINT_SERVICE_FIELDS = (
+    "availability",
+    "total_instances",
+    "healthy_instances",
+    "avg_response_time_ms",
+    "error_rate",
+    "total_requests"
+)
+
+@functools.lru_cache(maxsize=1)
+def _plotly_io():
+    """Importa plotly.io bajo demanda; retorna None si Plotly no está disponible"""
+    if not PLOTLY_AVAILABLE:
+        return None
+    try:
+        import plotly.io as pio
+    except ImportError:
+        logger.warning("Plotly instalado pero no se pudo importar - se usarán gráficas SVG")
+        return None
+    return pio
+
+@functools.lru_cache(maxsize=1)
+def _plotly_template() -> Dict[str, Any]:
+    """Template por defecto de Plotly como dict (se convierte una sola vez)"""
+    pio = _plotly_io()
+    return pio.templates[pio.templates.default].to_plotly_json()
+
 class ReportGenerator:
     """
     Generador de reportes completos para Chaos Engineering.
     """
     DIV_CLOSE = '</div>'
     
-    def __init__(self, output_directory: str = "./reports"):
+    def __init__(self, output_directory: str = "./reports", compress_html: bool = False):
         self.output_directory = output_directory
+        self._outdir = Path(output_directory)
+        
+        # Si es True, el HTML se escribe comprimido (.html.gz, gzip nivel 1)
+        self.compress_html = compress_html
         self.ensure_output_directory()
         
+        # Executor de un solo hilo para generación en segundo plano (se crea bajo demanda)
+        self._report_executor = None
+        
+        # Huella del estado -> archivos generados (los más recientes al final)
+        self._report_cache = OrderedDict()
+        
+        # id(servicio) -> (servicio, instante de lectura, métricas)
+        
         logger.info(f"ReportGenerator inicializado con directorio: {output_directory}")
     
     def ensure_output_directory(self):
         """Crea el directorio de salida si no existe"""
-        os.makedirs(self.output_directory, exist_ok=True)
+        self._outdir.mkdir(parents=True, exist_ok=True)
+    
+    def _output_path(self, filename: str) -> str:
+        """Ruta de un archivo dentro del directorio de salida"""
+        return str(self._outdir / filename)
     
     def generate_comprehensive_report(self, chaos_system, 
                                     include_charts: bool = True,
@@ -53,33 +229,114 @@ class ReportGenerator:
         analysis = self._generate_analysis(report_data)
         report_data["analysis"] = analysis
         
+        # Solo el HTML (gráficas incluidas) se reutiliza si el estado que muestra
+        # no cambió; JSON y CSV vuelcan todos los datos y se escriben siempre
+        cache_key = None
+        cached_html = None
+        if "html" in formats:
+            cache_key = (self._fingerprint(report_data), include_charts, self.compress_html)
+            cached_html = self._get_cached_html(cache_key)
+            if cached_html is not None:
+                logger.info(f"Reporte HTML sin cambios, reutilizando: {cached_html}")
+        
+        start = time.perf_counter()
+        
         # Generar gráficos si está disponible plotly
         charts = {}
-        if include_charts and PLOTLY_AVAILABLE:
+        if include_charts and "html" in formats and cached_html is None:
             charts = self._generate_charts(report_data)
             print(f"✅ Generando {len(charts)} gráficas interactivas...")
-        elif not PLOTLY_AVAILABLE:
-            logger.warning("Plotly no disponible - gráficas omitidas del reporte")
+            if not PLOTLY_AVAILABLE:
+                logger.warning("Plotly no disponible - solo se incluyen las gráficas SVG en el reporte")
         
-        # Generar reportes en diferentes formatos
-        output_files = {}
+        # Generar reportes en diferentes formatos. Cada escritor solo lee
+        # report_data, así que se ejecutan en paralelo y solapan su E/S
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        writers = [
+            ("html", self._generate_html_report, (report_data, charts, timestamp)),
+            ("json", self._generate_json_report, (report_data, timestamp)),
+            ("csv", self._generate_csv_reports, (report_data, timestamp))
+        ]
+        writers = [writer for writer in writers
+                   if writer[0] in formats and not (writer[0] == "html" and cached_html is not None)]
         
-        if "html" in formats:
-            html_file = self._generate_html_report(report_data, charts, timestamp)
-            output_files["html"] = html_file
-        
-        if "json" in formats:
-            json_file = self._generate_json_report(report_data, timestamp)
-            output_files["json"] = json_file
+        with ThreadPoolExecutor(max_workers=max(len(writers), 1), thread_name_prefix="report-writer") as executor:
+            futures = [(fmt, executor.submit(writer, *args)) for fmt, writer, args in writers]
+            output_files = {fmt: future.result() for fmt, future in futures}
         
-        if "csv" in formats:
-            csv_files = self._generate_csv_reports(report_data, timestamp)
-            output_files["csv"] = csv_files
+        if cached_html is not None:
+            output_files["html"] = cached_html
+            output_files = {fmt: output_files[fmt] for fmt in formats if fmt in output_files}
+        elif cache_key is not None and cache_key[0] is not None and \
+                time.perf_counter() - start >= _REPORT_CACHE_MIN_SECONDS:
+            self._report_cache[cache_key] = output_files["html"]
+            while len(self._report_cache) > _REPORT_CACHE_SIZE:
+                self._report_cache.popitem(last=False)
         
         logger.info(f"Reporte completo generado: {list(output_files.keys())}")
         return output_files
     
+    @staticmethod
+    def _fingerprint(report_data: Dict[str, Any]) -> str:
+        """
+        Huella corta de lo que muestra el reporte HTML.
+        
+        Solo entra una proyección estable de los datos: métricas visibles de
+        cada servicio, id y severidad de las alertas, estadísticas de
+        experimentos y datos de fases. Los relojes que cambian en cada lectura
+        (timestamps del monitoreo, uptime de instancias y del sistema) quedan
+        fuera; si entraran, la huella nunca se repetiría.
+        """
+        state = {
+            "services": [
+                [service_name, *[service_data.get(key) for key in _FINGERPRINT_SERVICE_FIELDS]]
+                for service_name, service_data in report_data.get("services", {}).items()
+            ],
+            "alerts": [
+                [alert.get("id"), alert.get("severity")]
+                for alert in report_data.get("monitoring", {}).get("active_alerts", [])
+            ],
+            "experiments": report_data.get("experiments", {}).get("statistics", {}),
+            "phase_data": report_data.get("phase_data", {})
+        }
+        try:
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(state, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+            else:
+                payload = json.dumps(state, sort_keys=True, default=str).encode("utf-8")
+        except (TypeError, ValueError):
+            return None  # Claves no ordenables: el reporte no se cachea
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
+    
+    def _get_cached_html(self, cache_key) -> str:
+        """Retorna la ruta del HTML cacheado para la clave si sigue en disco"""
+        filepath = self._report_cache.get(cache_key)
+        if filepath is None:
+            return None
+        
+        if not os.path.exists(filepath):
+            del self._report_cache[cache_key]
+            return None
+        
+        self._report_cache.move_to_end(cache_key)
+        return filepath
+    
+    def submit_comprehensive_report(self, chaos_system,
+                                    include_charts: bool = True,
+                                    formats: List[str] = None) -> Future:
+        """
+        Genera el reporte completo en un hilo de fondo y retorna un Future.
+        
+        Permite que la demo siga respondiendo mientras se construyen el HTML y
+        las gráficas; usar future.result() cuando se necesiten los archivos.
+        """
+        if self._report_executor is None:
+            self._report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report")
+        
+        return self._report_executor.submit(
+            self.generate_comprehensive_report, chaos_system, include_charts, formats
+        )
+    
     def _collect_system_data(self, chaos_system) -> Dict[str, Any]:
         """Recopila todos los datos del sistema"""
         data = {
@@ -145,25 +402,17 @@ class ReportGenerator:
         }
         
         try:
+            # Una sola pasada por los servicios; sus resultados los comparten
+            # el score, las recomendaciones y la evaluación de riesgos
+            service_stats = self._analyze_services(report_data.get("services", {}))
+            
             # Análisis de disponibilidad
-            total_services = len(report_data.get("services", {}))
-            healthy_services = 0
-            total_availability = 0.0
+            total_services = service_stats["total_services"]
+            analysis["weaknesses"].extend(service_stats["weaknesses"])
             
-            for service_name, service_data in report_data.get("services", {}).items():
-                availability = service_data.get("availability", 0)
-                total_availability += availability
-                
-                if availability > 90:
-                    healthy_services += 1
-                elif availability < 50:
-                    analysis["weaknesses"].append(
-                        f"Servicio {service_name} tiene baja disponibilidad ({availability:.1f}%)"
-                    )
-            
-            avg_availability = total_availability / max(1, total_services)
+            avg_availability = service_stats["sum_availability"] / max(1, total_services)
             analysis["summary"]["average_availability"] = avg_availability
-            analysis["summary"]["healthy_services_ratio"] = healthy_services / max(1, total_services)
+            analysis["summary"]["healthy_services_ratio"] = service_stats["healthy_services"] / max(1, total_services)
             
             # Análisis de experimentos
             experiments_data = report_data.get("experiments", {})
@@ -183,33 +432,108 @@ class ReportGenerator:
             # Análisis de alertas
             monitoring_data = report_data.get("monitoring", {})
             active_alerts = monitoring_data.get("active_alerts", [])
-            critical_alerts = [a for a in active_alerts if a.get("severity") == "CRITICAL"]
+            severity_counts = self._severity_counts(active_alerts)
+            critical_alerts = severity_counts.get("CRITICAL", 0)
             
             analysis["summary"]["active_alerts"] = len(active_alerts)
-            analysis["summary"]["critical_alerts"] = len(critical_alerts)
+            analysis["summary"]["critical_alerts"] = critical_alerts
+            analysis["summary"]["alerts_by_severity"] = dict(severity_counts)
             
             # Cálculo del Resilience Score
-            resilience_score = self._calculate_resilience_score(report_data)
+            resilience_score = self._calculate_resilience_score(report_data, service_stats, critical_alerts)
             analysis["resilience_score"] = resilience_score
             
             # Recomendaciones basadas en el análisis
-            analysis["recommendations"] = self._generate_recommendations(report_data, analysis)
+            analysis["recommendations"] = self._generate_recommendations(report_data, analysis, service_stats)
             
             # Evaluación de riesgos
-            analysis["risk_assessment"] = self._assess_risks(report_data)
+            analysis["risk_assessment"] = self._assess_risks(report_data, service_stats, critical_alerts)
             
         except Exception as e:
             logger.error(f"Error generando análisis: {e}")
         
         return analysis
     
-    def _calculate_resilience_score(self, report_data: Dict[str, Any]) -> float:
+    def _service_columns(self, services: Dict[str, Dict[str, Any]]) -> Dict[str, tuple]:
+        """
+        Vista por columnas de las métricas de servicios: una tupla por métrica,
+        alineadas con "names". Es la base de _analyze_services y de las gráficas.
+        """
+        rows = tuple(services.values())
+        return {
+            "names": tuple(services),
+            "availability": tuple(s.get("availability", 0) for s in rows),
+            "total_instances": tuple(s.get("total_instances", 0) for s in rows),
+            "healthy_instances": tuple(s.get("healthy_instances", 0) for s in rows),
+            "avg_response_time_ms": tuple(s.get("avg_response_time_ms", 0) for s in rows),
+        }
+    
+    def _analyze_services(self, services: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Recorre los servicios una sola vez y calcula todo lo que necesitan el
+        análisis, el score, las recomendaciones y la evaluación de riesgos
+        (sumas, servicios débiles, sin redundancia y riesgos por servicio).
+        """
+        columns = self._service_columns(services)
+        stats = {
+            "total_services": len(columns["names"]),
+            "sum_availability": sum(columns["availability"]),
+            "total_instances": sum(columns["total_instances"]),
+            "healthy_instances": sum(columns["healthy_instances"]),
+            "healthy_services": 0,
+            "weaknesses": [],
+            "low_availability": [],
+            "single_instance": [],
+            "high_risk": [],
+            "medium_risk": []
+        }
+        
+        for name, availability, instances in zip(
+            columns["names"], columns["availability"], columns["total_instances"]
+        ):
+            if availability > 90:
+                stats["healthy_services"] += 1
+            elif availability < 90:
+                stats["low_availability"].append(name)
+            
+            if availability < 50:
+                stats["weaknesses"].append(
+                    f"Servicio {name} tiene baja disponibilidad ({availability:.1f}%)"
+                )
+                stats["high_risk"].append(f"Servicio {name} con disponibilidad crítica")
+            elif availability < 80:
+                stats["medium_risk"].append(f"Servicio {name} con disponibilidad baja")
+            
+            if instances == 1:
+                stats["single_instance"].append(name)
+                stats["medium_risk"].append(f"Servicio {name} sin redundancia")
+        
+        return stats
+    
+    @staticmethod
+    def _severity_counts(alerts: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Cuenta alertas por severidad en una pasada (Counter sobre map, sin listas filtradas).
+        
+        Las alertas del monitoreo siempre traen "severity" (campo obligatorio de
+        Alert), así que se indexa directamente; solo si falta en alguna se repite
+        el conteo con .get() y "UNKNOWN" por defecto.
+        """
+        try:
+            return Counter(map(_SEVERITY_KEY, alerts))
+        except KeyError:
+            return Counter(map(methodcaller("get", "severity", "UNKNOWN"), alerts))
+    
+    def _calculate_resilience_score(self, report_data: Dict[str, Any], service_stats: Dict[str, Any] = None,
+                                    critical_alerts: int = None) -> float:
         """Calcula un score de resiliencia del sistema (0-100)"""
         try:
+            if service_stats is None:
+                service_stats = self._analyze_services(report_data.get("services", {}))
+            
             # Disponibilidad de servicios (40% del score)
-            services = report_data.get("services", {})
-            if services:
-                avg_availability = sum(s.get("availability", 0) for s in services.values()) / len(services)
+            if service_stats["total_services"]:
+                avg_availability = service_stats["sum_availability"] / service_stats["total_services"]
                 availability_score = (avg_availability / 100) * 40
             else:
                 availability_score = 0
@@ -217,10 +541,11 @@ class ReportGenerator:
             # Alertas activas (20% del score)
             monitoring = report_data.get("monitoring", {})
             active_alerts = monitoring.get("active_alerts", [])
-            critical_alerts = [a for a in active_alerts if a.get("severity") == "CRITICAL"]
+            if critical_alerts is None:
+                critical_alerts = self._severity_counts(active_alerts).get("CRITICAL", 0)
             
-            if len(critical_alerts) > 0:
-                alerts_score = max(0, 20 - len(critical_alerts) * 5)
+            if critical_alerts > 0:
+                alerts_score = max(0, 20 - critical_alerts * 5)
             elif len(active_alerts) > 5:
                 alerts_score = max(0, 20 - (len(active_alerts) - 5) * 2)
             else:
@@ -236,12 +561,8 @@ class ReportGenerator:
                 experiment_score = 10  # Score medio si no hay experimentos
             
             # Diversidad de instancias (10% del score)
-            total_instances = 0
-            healthy_instances = 0
-            
-            for service_data in services.values():
-                total_instances += service_data.get("total_instances", 0)
-                healthy_instances += service_data.get("healthy_instances", 0)
+            total_instances = service_stats["total_instances"]
+            healthy_instances = service_stats["healthy_instances"]
             
             if total_instances > 0:
                 instance_health_ratio = healthy_instances / total_instances
@@ -260,11 +581,15 @@ class ReportGenerator:
             logger.error(f"Error calculando resilience score: {e}")
             return 50.0  # Score neutro en caso de error
     
-    def _generate_recommendations(self, report_data: Dict[str, Any], analysis: Dict[str, Any]) -> List[str]:
+    def _generate_recommendations(self, report_data: Dict[str, Any], analysis: Dict[str, Any],
+                                  service_stats: Dict[str, Any] = None) -> List[str]:
         """Genera recomendaciones basadas en el análisis"""
         recommendations = []
         
         try:
+            if service_stats is None:
+                service_stats = self._analyze_services(report_data.get("services", {}))
+            
             resilience_score = analysis.get("resilience_score", 0)
             
             # Recomendaciones basadas en resilience score
@@ -274,11 +599,7 @@ class ReportGenerator:
                 recommendations.append("⚠️ Score de resiliencia bajo - Implementar mejoras de estabilidad")
             
             # Recomendaciones basadas en disponibilidad
-            services = report_data.get("services", {})
-            low_availability_services = [
-                name for name, data in services.items() 
-                if data.get("availability", 0) < 90
-            ]
+            low_availability_services = service_stats["low_availability"]
             
             if low_availability_services:
                 recommendations.append(
@@ -286,10 +607,7 @@ class ReportGenerator:
                 )
             
             # Recomendaciones basadas en instancias
-            single_instance_services = [
-                name for name, data in services.items()
-                if data.get("total_instances", 0) == 1
-            ]
+            single_instance_services = service_stats["single_instance"]
             
             if single_instance_services:
                 recommendations.append(
@@ -305,12 +623,11 @@ class ReportGenerator:
                 elif stats.get("success_rate", 0) < 70:
                     recommendations.append("🔧 Investigar causas de falla en experimentos de chaos")
             
-            # Recomendaciones basadas en alertas
-            monitoring = report_data.get("monitoring", {})
-            critical_alerts = [
-                a for a in monitoring.get("active_alerts", [])
-                if a.get("severity") == "CRITICAL"
-            ]
+            # Recomendaciones basadas en alertas (conteo ya calculado en el resumen)
+            critical_alerts = analysis.get("summary", {}).get("critical_alerts")
+            if critical_alerts is None:
+                monitoring = report_data.get("monitoring", {})
+                critical_alerts = self._severity_counts(monitoring.get("active_alerts", [])).get("CRITICAL", 0)
             
             if critical_alerts:
                 recommendations.append("🚨 Resolver alertas críticas inmediatamente")
@@ -329,7 +646,8 @@ class ReportGenerator:
         
         return recommendations
     
-    def _assess_risks(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_risks(self, report_data: Dict[str, Any], service_stats: Dict[str, Any] = None,
+                      critical_alerts: int = None) -> Dict[str, Any]:
         """Evalúa riesgos del sistema"""
         risks = {
             "high_risk": [],
@@ -339,30 +657,21 @@ class ReportGenerator:
         }
         
         try:
-            # Riesgos basados en disponibilidad
-            services = report_data.get("services", {})
-            for service_name, service_data in services.items():
-                availability = service_data.get("availability", 0)
-                instances = service_data.get("total_instances", 0)
-                
-                if availability < 50:
-                    risks["high_risk"].append(f"Servicio {service_name} con disponibilidad crítica")
-                elif availability < 80:
-                    risks["medium_risk"].append(f"Servicio {service_name} con disponibilidad baja")
-                
-                if instances == 1:
-                    risks["medium_risk"].append(f"Servicio {service_name} sin redundancia")
+            if service_stats is None:
+                service_stats = self._analyze_services(report_data.get("services", {}))
+            
+            # Riesgos basados en disponibilidad y redundancia de cada servicio
+            risks["high_risk"].extend(service_stats["high_risk"])
+            risks["medium_risk"].extend(service_stats["medium_risk"])
             
             # Riesgos basados en alertas
-            monitoring = report_data.get("monitoring", {})
-            critical_alerts = [
-                a for a in monitoring.get("active_alerts", [])
-                if a.get("severity") == "CRITICAL"
-            ]
+            if critical_alerts is None:
+                monitoring = report_data.get("monitoring", {})
+                critical_alerts = self._severity_counts(monitoring.get("active_alerts", [])).get("CRITICAL", 0)
             
-            if len(critical_alerts) > 3:
+            if critical_alerts > 3:
                 risks["high_risk"].append("Múltiples alertas críticas activas")
-            elif len(critical_alerts) > 0:
+            elif critical_alerts > 0:
                 risks["medium_risk"].append("Alertas críticas activas")
             
             # Determinar nivel de riesgo general
@@ -379,104 +688,157 @@ class ReportGenerator:
         return risks
     
     def _generate_charts(self, report_data: Dict[str, Any]) -> Dict[str, str]:
-        """Genera gráficos usando Plotly"""
+        """
+        Genera gráficos (Plotly, o SVG inline para la disponibilidad).
+        
+        Las gráficas son independientes, así que se construyen en
+        paralelo y se recogen en el orden original.
+        """
         charts = {}
         print("🟢 [DEBUG] Entrando a _generate_charts...")
-        try:
-            # Gráfico de disponibilidad de servicios
-            print("[DEBUG] Intentando generar gráfica de disponibilidad...")
-            availability_chart = self._create_availability_chart(report_data)
-            if availability_chart:
-                charts["availability"] = availability_chart
-                print("[DEBUG] Gráfica de disponibilidad generada!")
-            else:
-                print("[DEBUG] Gráfica de disponibilidad VACÍA")
-            
-            # Gráfico de métricas de tiempo de respuesta
-            print("[DEBUG] Intentando generar gráfica de tiempo de respuesta...")
-            response_chart = self._create_response_time_chart(report_data)
-            if response_chart:
-                charts["response_time"] = response_chart
-                print("[DEBUG] Gráfica de tiempo de respuesta generada!")
-            else:
-                print("[DEBUG] Gráfica de tiempo de respuesta VACÍA")
-            
-            # Gráfico de alertas
-            print("[DEBUG] Intentando generar gráfica de alertas...")
-            alerts_chart = self._create_alerts_chart(report_data)
-            if alerts_chart:
-                charts["alerts"] = alerts_chart
-                print("[DEBUG] Gráfica de alertas generada!")
-            else:
-                print("[DEBUG] Gráfica de alertas VACÍA")
-            
-            # Gráfico de experimentos
-            print("[DEBUG] Intentando generar gráfica de experimentos...")
-            experiments_chart = self._create_experiments_chart(report_data)
-            if experiments_chart:
-                charts["experiments"] = experiments_chart
-                print("[DEBUG] Gráfica de experimentos generada!")
-            else:
-                print("[DEBUG] Gráfica de experimentos VACÍA")
+        columns = self._service_columns(report_data.get("services", {}))
+        
+        builders = [
+            ("availability", "disponibilidad", self._create_availability_chart, (report_data, columns))
+        ]
+        
+        # El resto de gráficas solo existen en versión Plotly (aquí se importa)
+        if _plotly_io() is not None:
+            builders += [
+                ("response_time", "tiempo de respuesta", self._create_response_time_chart, (report_data, columns)),
+                ("alerts", "alertas", self._create_alerts_chart, (report_data,)),
+                ("experiments", "experimentos", self._create_experiments_chart, (report_data,))
+            ]
+        
+        with ThreadPoolExecutor(max_workers=len(builders), thread_name_prefix="chart") as executor:
+            futures = [
+                (key, label, executor.submit(builder, *args))
+                for key, label, builder, args in builders
+            ]
             
-            print(f"[DEBUG] Total de gráficas generadas: {len(charts)}")
-        except Exception as e:
-            logger.error(f"[ERROR] Excepción en _generate_charts: {e}")
-            print(f"[ERROR] Excepción en _generate_charts: {e}")
-            import traceback
-            traceback.print_exc()
+            for key, label, future in futures:
+                try:
+                    chart = future.result()
+                except Exception as e:
+                    logger.error(f"[ERROR] Excepción generando gráfica de {label}: {e}")
+                    print(f"[ERROR] Excepción generando gráfica de {label}: {e}")
+                    continue
+                
+                if chart:
+                    charts[key] = chart
+                    print(f"[DEBUG] Gráfica de {label} generada!")
+                else:
+                    print(f"[DEBUG] Gráfica de {label} VACÍA")
+        
+        print(f"[DEBUG] Total de gráficas generadas: {len(charts)}")
         return charts
     
-    def _create_availability_chart(self, report_data: Dict[str, Any]) -> str:
+    def _create_availability_chart(self, report_data: Dict[str, Any], columns: Dict[str, tuple] = None) -> str:
         """Crea gráfico de disponibilidad de servicios"""
-        services = report_data.get("services", {})
+        if columns is None:
+            columns = self._service_columns(report_data.get("services", {}))
         
-        if not services:
+        if not columns["names"]:
             return ""
         
+        if len(columns["names"]) <= _SVG_MAX_POINTS or _plotly_io() is None:
+            return self._svg_bar(columns["names"], columns["availability"],
+                                 title="Disponibilidad de Servicios (%)")
+        
         try:
-            service_names = list(services.keys())
-            availabilities = [services[name].get("availability", 0) for name in service_names]
-            
-            fig = go.Figure(data=[
-                go.Bar(x=service_names, y=availabilities, 
-                      marker_color=['red' if a < 90 else 'yellow' if a < 95 else 'green' for a in availabilities])
-            ])
-            
-            fig.update_layout(
-                title="Disponibilidad de Servicios (%)",
-                xaxis_title="Servicios",
-                yaxis_title="Disponibilidad (%)",
-                yaxis_range=[0, 100]
-            )
+            service_names = list(columns["names"])
+            availabilities = list(columns["availability"])
             
-            return fig.to_html(full_html=False, include_plotlyjs='cdn')
+            return self._plotly_html(
+                [{
+                    "type": "bar",
+                    "x": service_names,
+                    "y": availabilities,
+                    "marker": {"color": ['red' if a < 90 else 'yellow' if a < 95 else 'green' for a in availabilities]}
+                }],
+                {
+                    "title": {"text": "Disponibilidad de Servicios (%)"},
+                    "xaxis": {"title": {"text": "Servicios"}},
+                    "yaxis": {"title": {"text": "Disponibilidad (%)"}, "range": [0, 100]}
+                }
+            )
             
         except Exception as e:
             logger.error(f"Error generando gráfica de disponibilidad: {e}")
             return ""
     
-    def _create_response_time_chart(self, report_data: Dict[str, Any]) -> str:
+    @staticmethod
+    def _svg_bar(labels, values, thresholds=(90, 95), title: str = "") -> str:
+        """
+        Dibuja un gráfico de barras (escala 0-100) como SVG inline.
+        
+        Las barras se colorean igual que en la versión Plotly: rojo por debajo
+        del primer umbral, amarillo por debajo del segundo y verde en adelante.
+        """
+        low, high = thresholds
+        step = _SVG_BAR_WIDTH + _SVG_BAR_GAP
+        top = 40
+        bottom = top + _SVG_PLOT_HEIGHT
+        
+        # Etiquetas del eje X giradas -45° (como los ticks de Plotly) para que los
+        # nombres largos no se solapen; los muy largos se recortan y el nombre
+        # completo queda como tooltip (<title>)
+        names = [str(label) for label in labels]
+        shown = [
+            name if len(name) <= _SVG_LABEL_MAX_CHARS else name[:_SVG_LABEL_MAX_CHARS - 1] + "…"
+            for name in names
+        ]
+        longest = max((len(name) for name in shown), default=0)
+        label_extent = math.ceil(longest * _SVG_CHAR_WIDTH * math.sqrt(0.5))  # Alto y ancho a 45°
+        label_y = bottom + 12
+        
+        # Margen izquierdo para que la etiqueta de la primera barra no se salga
+        left = max(_SVG_BAR_GAP, label_extent - _SVG_BAR_WIDTH // 2 - _SVG_BAR_GAP // 2 + 5)
+        width = max(left + _SVG_BAR_GAP + step * len(names), 300)  # Deja sitio al título
+        height = label_y + label_extent + 10
+        
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'font-family="Arial, sans-serif" font-size="12">',
+            f'<text x="{_SVG_BAR_GAP}" y="20" font-size="16">{html.escape(title)}</text>',
+            f'<line x1="{left}" y1="{bottom}" x2="{width - _SVG_BAR_GAP}" y2="{bottom}" stroke="#999"/>'
+        ]
+        for i, (name, label_text, value) in enumerate(zip(names, shown, values)):
+            clamped = min(max(value, 0), 100)
+            bar_height = clamped * _SVG_PLOT_HEIGHT / 100
+            x = left + i * step + _SVG_BAR_GAP / 2
+            center = x + _SVG_BAR_WIDTH / 2
+            color = 'red' if value < low else 'yellow' if value < high else 'green'
+            parts.append(
+                f'<rect x="{x:g}" y="{bottom - bar_height:g}" width="{_SVG_BAR_WIDTH}" '
+                f'height="{bar_height:g}" fill="{color}" stroke="#666"/>'
+                f'<text x="{center:g}" y="{bottom - bar_height - 4:g}" text-anchor="middle">{value:.1f}</text>'
+                f'<text x="{center:g}" y="{label_y}" text-anchor="end" '
+                f'transform="rotate(-45 {center:g} {label_y})">'
+                f'<title>{html.escape(name)}</title>{html.escape(label_text)}</text>'
+            )
+        parts.append('</svg>')
+        return "".join(parts)
+    
+    def _create_response_time_chart(self, report_data: Dict[str, Any], columns: Dict[str, tuple] = None) -> str:
         """Crea gráfico de tiempos de respuesta"""
-        services = report_data.get("services", {})
+        if columns is None:
+            columns = self._service_columns(report_data.get("services", {}))
         
-        if not services:
+        if not columns["names"]:
             return ""
         
-        service_names = list(services.keys())
-        response_times = [services[name].get("avg_response_time_ms", 0) for name in service_names]
-        
-        fig = go.Figure(data=[
-            go.Scatter(x=service_names, y=response_times, mode='lines+markers')
-        ])
+        service_names = list(columns["names"])
+        response_times = list(columns["avg_response_time_ms"])
         
-        fig.update_layout(
-            title="Tiempo de Respuesta Promedio por Servicio",
-            xaxis_title="Servicios",
-            yaxis_title="Tiempo de Respuesta (ms)"
+        return self._plotly_html(
+            [{"type": "scatter", "x": service_names, "y": response_times, "mode": "lines+markers"}],
+            {
+                "title": {"text": "Tiempo de Respuesta Promedio por Servicio"},
+                "xaxis": {"title": {"text": "Servicios"}},
+                "yaxis": {"title": {"text": "Tiempo de Respuesta (ms)"}}
+            }
         )
-        
-        return fig.to_html(full_html=False, include_plotlyjs='cdn')
     
     def _create_alerts_chart(self, report_data: Dict[str, Any]) -> str:
         """Crea gráfico de alertas"""
@@ -486,20 +848,20 @@ class ReportGenerator:
         if not alerts:
             return "<p>No hay alertas activas</p>"
         
-        severity_counts = {}
-        for alert in alerts:
-            severity = alert.get("severity", "UNKNOWN")
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        # Conteo ya calculado por el análisis; si no está, se recalcula
+        severity_counts = report_data.get("analysis", {}).get("summary", {}).get("alerts_by_severity")
+        if severity_counts is None:
+            severity_counts = self._severity_counts(alerts)
         
-        fig = go.Figure(data=[
-            go.Pie(labels=list(severity_counts.keys()), 
-                  values=list(severity_counts.values()),
-                  marker_colors=['red', 'orange', 'yellow', 'blue'])
-        ])
-        
-        fig.update_layout(title="Distribución de Alertas por Severidad")
-        
-        return fig.to_html(full_html=False, include_plotlyjs='cdn')
+        return self._plotly_html(
+            [{
+                "type": "pie",
+                "labels": list(severity_counts.keys()),
+                "values": list(severity_counts.values()),
+                "marker": {"colors": ['red', 'orange', 'yellow', 'blue']}
+            }],
+            {"title": {"text": "Distribución de Alertas por Severidad"}}
+        )
     
     def _create_experiments_chart(self, report_data: Dict[str, Any]) -> str:
         """Crea gráfico de experimentos"""
@@ -512,31 +874,64 @@ class ReportGenerator:
         successful = stats.get("successful_experiments", 0)
         failed = stats.get("failed_experiments", 0)
         
-        fig = go.Figure(data=[
-            go.Pie(labels=['Exitosos', 'Fallidos'], 
-                  values=[successful, failed],
-                  marker_colors=['green', 'red'])
-        ])
-        
-        fig.update_layout(title="Resultados de Experimentos de Chaos")
+        return self._plotly_html(
+            [{
+                "type": "pie",
+                "labels": ['Exitosos', 'Fallidos'],
+                "values": [successful, failed],
+                "marker": {"colors": ['green', 'red']}
+            }],
+            {"title": {"text": "Resultados de Experimentos de Chaos"}}
+        )
+    
+    @staticmethod
+    def _plotly_html(data: List[Dict[str, Any]], layout: Dict[str, Any]) -> str:
+        """
+        Renderiza una figura Plotly descrita como dict, sin construir go.Figure.
         
-        return fig.to_html(full_html=False, include_plotlyjs='cdn')
+        Se omite la validación de propiedades (validate=False); el template por
+        defecto se añade a mano para que el aspecto sea el mismo que con go.Figure.
+        """
+        figure = {"data": data, "layout": {"template": _plotly_template(), **layout}}
+        return _plotly_io().to_html(figure, full_html=False, include_plotlyjs='cdn', validate=False)
     
     def _generate_html_report(self, report_data: Dict[str, Any], charts: Dict[str, str], timestamp: str) -> str:
         """Genera reporte en formato HTML"""
-        html_content = self._create_html_template(report_data, charts)
-        
         filename = f"chaos_engineering_report_{timestamp}.html"
-        filepath = os.path.join(self.output_directory, filename)
+        filepath = self._output_path(filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        if self.compress_html:
+            filepath += ".gz"
+        
+        # Cada sección se escribe al archivo en cuanto se genera, sin armar el
+        # documento completo en memoria. Se escribe a un nombre temporal y se
+        # renombra al terminar: si una sección falla no queda un HTML a medias
+        tmp_path = filepath + ".tmp"
+        try:
+            if self.compress_html:
+                # Nivel 1: compresión rápida que reduce bastante el HTML (gráficas y estilos)
+                with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=1) as f:
+                    self._write_html(report_data, charts, f)
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    self._write_html(report_data, charts, f)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         
         logger.info(f"Reporte HTML generado: {filepath}")
         return filepath
     
     def _create_html_template(self, report_data: Dict[str, Any], charts: Dict[str, str]) -> str:
         """Crea el template HTML para el reporte"""
+        buffer = io.StringIO()
+        self._write_html(report_data, charts, buffer)
+        return buffer.getvalue()
+    
+    def _write_html(self, report_data: Dict[str, Any], charts: Dict[str, str], out: TextIO):
+        """Escribe el reporte HTML sección por sección en `out` (archivo o buffer de texto)"""
         analysis = report_data.get("analysis", {})
         timestamp = datetime.fromtimestamp(report_data.get("timestamp", time.time()))
 
@@ -548,71 +943,28 @@ class ReportGenerator:
         else:
             score_class = ''
 
-        html = self._html_header(timestamp, resilience_score, score_class, analysis)
-        html += self._html_charts_section(charts)
-        html += self._html_analysis_section(analysis)
-        html += self._html_recommendations_section(analysis)
-        html += self._html_risk_section(analysis)
-        html += self._html_phase_comparison_section(report_data)
-        html += self._html_services_section(report_data)
-        html += '''
+        out.write(self._html_header(timestamp, resilience_score, score_class, analysis))
+        out.write(self._html_charts_section(charts))
+        out.write(self._html_analysis_section(analysis))
+        out.write(self._html_recommendations_section(analysis))
+        out.write(self._html_risk_section(analysis))
+        out.write(self._html_phase_comparison_section(report_data))
+        out.write(self._html_services_section(report_data))
+        out.write('''
 </body>
 </html>
-'''
-        return html
+''')
 
     def _html_header(self, timestamp, resilience_score, score_class, analysis):
-        return f"""
-<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Reporte de Chaos Engineering</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
-        .header {{ background-color: #2c3e50; color: white; padding: 20px; border-radius: 8px; }}
-        .section {{ background-color: white; margin: 20px 0; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .metric {{ display: inline-block; margin: 10px; padding: 15px; background-color: #ecf0f1; border-radius: 5px; }}
-        .score {{ font-size: 48px; font-weight: bold; color: #e74c3c; }}
-        .score.good {{ color: #27ae60; }}
-        .score.medium {{ color: #f39c12; }}
-        .recommendation {{ background-color: #e8f5e9; border-left: 4px solid #4caf50; padding: 10px; margin: 5px 0; }}
-        .weakness {{ background-color: #ffebee; border-left: 4px solid #f44336; padding: 10px; margin: 5px 0; }}
-        .strength {{ background-color: #e3f2fd; border-left: 4px solid #2196f3; padding: 10px; margin: 5px 0; }}
-        .risk-high {{ color: #f44336; font-weight: bold; }}
-        .risk-medium {{ color: #ff9800; font-weight: bold; }}
-        .risk-low {{ color: #4caf50; font-weight: bold; }}
-        table {{ width: 100%; border-collapse: collapse; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🔥 Reporte de Chaos Engineering</h1>
-        <p>Generado el: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>
-    </div>
-    <div class="section">
-        <h2>📊 Resumen Ejecutivo</h2>
-        <div class="metric">
-            <div class="score {score_class}">{resilience_score:.1f}</div>
-            <div>Resilience Score</div>
-        </div>
-        <div class="metric">
-            <div style="font-size: 24px;">{analysis.get('summary', {}).get('average_availability', 0):.1f}%</div>
-            <div>Disponibilidad Promedio</div>
-        </div>
-        <div class="metric">
-            <div style="font-size: 24px;">{analysis.get('summary', {}).get('total_experiments', 0)}</div>
-            <div>Experimentos Ejecutados</div>
-        </div>
-        <div class="metric">
-            <div style="font-size: 24px;">{analysis.get('summary', {}).get('active_alerts', 0)}</div>
-            <div>Alertas Activas</div>
-        </div>
-    </div>
-"""
+        summary = analysis.get('summary', {})
+        return _HTML_HEAD + _HTML_SUMMARY_TEMPLATE.format_map({
+            "generated_at": timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+            "score_class": score_class,
+            "resilience_score": resilience_score,
+            "average_availability": summary.get('average_availability', 0),
+            "total_experiments": summary.get('total_experiments', 0),
+            "active_alerts": summary.get('active_alerts', 0),
+        })
 
     def _html_charts_section(self, charts):
         if not charts:
@@ -634,12 +986,11 @@ class ReportGenerator:
 </div>
 '''
         
-        html = '<div class="section"><h2>📈 Métricas Visuales</h2>'
-        for chart_name, chart_html in charts.items():
-            if chart_html:
-                html += f'<div style="margin: 20px 0;">{chart_html}</div>'
-        html += self.DIV_CLOSE
-        return html
+        return (
+            '<div class="section"><h2>📈 Métricas Visuales</h2>'
+            + "".join(f'<div style="margin: 20px 0;">{chart_html}</div>' for chart_html in charts.values() if chart_html)
+            + self.DIV_CLOSE
+        )
        
 
     def _html_analysis_section(self, analysis):
@@ -647,44 +998,43 @@ class ReportGenerator:
         weaknesses = analysis.get('weaknesses', [])
         if not (strengths or weaknesses):
             return ''
-        html = '<div class="section"><h2>🔍 Análisis</h2>'
+        parts = ['<div class="section"><h2>🔍 Análisis</h2>']
         if strengths:
-            html += '<h3>💪 Fortalezas</h3>'
-            for strength in strengths:
-                html += f'<div class="strength">{strength}</div>'
+            parts.append('<h3>💪 Fortalezas</h3>')
+            parts.extend(f'<div class="strength">{strength}</div>' for strength in strengths)
         if weaknesses:
-            html += '<h3>⚠️ Áreas de Mejora</h3>'
-            for weakness in weaknesses:
-                html += f'<div class="weakness">{weakness}</div>'
-        html += self.DIV_CLOSE
-        return html
+            parts.append('<h3>⚠️ Áreas de Mejora</h3>')
+            parts.extend(f'<div class="weakness">{weakness}</div>' for weakness in weaknesses)
+        parts.append(self.DIV_CLOSE)
+        return "".join(parts)
 
     def _html_recommendations_section(self, analysis):
         recommendations = analysis.get('recommendations', [])
         if not recommendations:
             return ''
-        html = '<div class="section"><h2>💡 Recomendaciones</h2>'
-        for recommendation in recommendations:
-            html += f'<div class="recommendation">{recommendation}</div>'
-        html += '</div>'
-        return html
+        return (
+            '<div class="section"><h2>💡 Recomendaciones</h2>'
+            + "".join(f'<div class="recommendation">{recommendation}</div>' for recommendation in recommendations)
+            + self.DIV_CLOSE
+        )
 
     def _html_risk_section(self, analysis):
         risk_assessment = analysis.get('risk_assessment', {})
         if not risk_assessment:
             return ''
-        html = '<div class="section"><h2>⚠️ Evaluación de Riesgos</h2>'
-        html += f'<p>Nivel de Riesgo General: <span class="risk-{risk_assessment.get("overall_risk_level", "low").lower()}">{risk_assessment.get("overall_risk_level", "LOW")}</span></p>'
+        parts = [
+            '<div class="section"><h2>⚠️ Evaluación de Riesgos</h2>',
+            f'<p>Nivel de Riesgo General: <span class="risk-{risk_assessment.get("overall_risk_level", "low").lower()}">{risk_assessment.get("overall_risk_level", "LOW")}</span></p>'
+        ]
         for risk_level in ['high_risk', 'medium_risk', 'low_risk']:
             risks = risk_assessment.get(risk_level, [])
             if risks:
                 level_name = risk_level.replace('_', ' ').title()
-                html += f'<h4>{level_name}</h4><ul>'
-                for risk in risks:
-                    html += f'<li>{risk}</li>'
-                html += '</ul>'
-        html += '</div>'
-        return html
+                parts.append(f'<h4>{level_name}</h4><ul>')
+                parts.extend(f'<li>{risk}</li>' for risk in risks)
+                parts.append('</ul>')
+        parts.append(self.DIV_CLOSE)
+        return "".join(parts)
 
     def _html_phase_comparison_section(self, report_data: Dict[str, Any]) -> str:
         """Genera una sección de comparación de fases."""
@@ -698,11 +1048,11 @@ class ReportGenerator:
             return ""
 
         # Generar HTML para la sección de comparación de fases
-        html = '<div class="section"><h2>📊 Comparación de Fases</h2>'
+        parts = ['<div class="section"><h2>📊 Comparación de Fases</h2>']
         
         # Tabla resumen de fases
-        html += '<h3>📈 Resumen por Fase</h3>'
-        html += '<table><tr><th>Fase</th><th>Duración (s)</th><th>Disponibilidad Inicial</th><th>Disponibilidad Final</th><th>Eventos</th><th>Cambios Principales</th></tr>'
+        parts.append('<h3>📈 Resumen por Fase</h3>')
+        parts.append('<table><tr><th>Fase</th><th>Duración (s)</th><th>Disponibilidad Inicial</th><th>Disponibilidad Final</th><th>Eventos</th><th>Cambios Principales</th></tr>')
         
         for phase_name, phase_info in phases_summary.items():
             duration = phase_info.get("duration", 0)
@@ -720,7 +1070,7 @@ class ReportGenerator:
             else:
                 row_class = ''
             
-            html += f'''
+            parts.append(f'''
             <tr {row_class}>
                 <td><strong>{phase_name}</strong></td>
                 <td>{duration:.1f}</td>
@@ -729,48 +1079,54 @@ class ReportGenerator:
                 <td>{events_count}</td>
                 <td>{', '.join(major_changes) if major_changes else 'Sin cambios significativos'}</td>
             </tr>
-            '''
+            ''')
         
-        html += '</table>'
+        parts.append('</table>')
 
         # Insights de fases
         key_insights = phase_data.get("key_insights", [])
         if key_insights:
-            html += '<h3>💡 Insights Clave</h3>'
-            html += '<ul>'
-            for insight in key_insights:
-                html += f'<li>{insight}</li>'
-            html += '</ul>'
+            parts.append('<h3>💡 Insights Clave</h3>')
+            parts.append('<ul>')
+            parts.extend(f'<li>{insight}</li>' for insight in key_insights)
+            parts.append('</ul>')
 
-        html += self.DIV_CLOSE
-        return html
+        parts.append(self.DIV_CLOSE)
+        return "".join(parts)
 
     def _html_services_section(self, report_data):
         services = report_data.get('services', {})
         if not services:
             return ''
-        html = '<div class="section"><h2>🔧 Estado de Servicios</h2>'
-        html += '<table><tr><th>Servicio</th><th>Disponibilidad</th><th>Instancias</th><th>Tiempo Respuesta</th><th>Tasa de Error</th></tr>'
-        for service_name, service_data in services.items():
-            html += f"""
-            <tr>
-                <td>{service_name}</td>
-                <td>{service_data.get('availability', 0):.1f}%</td>
-                <td>{service_data.get('healthy_instances', 0)}/{service_data.get('total_instances', 0)}</td>
-                <td>{service_data.get('avg_response_time_ms', 0):.1f}ms</td>
-                <td>{service_data.get('error_rate', 0):.2f}%</td>
-            </tr>
-            """
-        html += '</table></div>'
-        return html
+        # Tupla de valores por servicio y un único format posicional por fila
+        # (sin copiar el dict completo de métricas de cada servicio)
+        row_values = [
+            (service_name, *[service_data.get(key, default) for key, default in _SERVICE_ROW_FIELDS])
+            for service_name, service_data in services.items()
+        ]
+        rows = "".join(_SERVICE_ROW_TEMPLATE.format(*values) for values in row_values)
+        return (
+            '<div class="section"><h2>🔧 Estado de Servicios</h2>'
+            '<table><tr><th>Servicio</th><th>Disponibilidad</th><th>Instancias</th><th>Tiempo Respuesta</th><th>Tasa de Error</th></tr>'
+            + rows + '</table></div>'
+        )
     
     def _generate_json_report(self, report_data: Dict[str, Any], timestamp: str) -> str:
         """Genera reporte en formato JSON"""
         filename = f"chaos_engineering_report_{timestamp}.json"
-        filepath = os.path.join(self.output_directory, filename)
+        filepath = self._output_path(filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False, default=str)
+        if ORJSON_AVAILABLE:
+            # orjson produce bytes UTF-8 directamente (equivale a ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    report_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str
+                ))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(report_data, f, indent=2, ensure_ascii=False, default=str)
         
         logger.info(f"Reporte JSON generado: {filepath}")
         return filepath
@@ -783,23 +1139,15 @@ class ReportGenerator:
         services = report_data.get('services', {})
         if services:
             filename = f"services_report_{timestamp}.csv"
-            filepath = os.path.join(self.output_directory, filename)
+            filepath = self._output_path(filename)
             
             with open(filepath, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
-                writer.writerow(['Servicio', 'Disponibilidad', 'Instancias_Totales', 'Instancias_Saludables', 
-                               'Tiempo_Respuesta_ms', 'Tasa_Error_pct', 'Total_Requests'])
-                
-                for service_name, service_data in services.items():
-                    writer.writerow([
-                        service_name,
-                        service_data.get('availability', 0),
-                        service_data.get('total_instances', 0),
-                        service_data.get('healthy_instances', 0),
-                        service_data.get('avg_response_time_ms', 0),
-                        service_data.get('error_rate', 0),
-                        service_data.get('total_requests', 0)
-                    ])
+                writer.writerow(_SERVICES_CSV_HEADER)
+                writer.writerows(
+                    [service_name, *[service_data.get(key, default) for key, default in _SERVICES_CSV_FIELDS]]
+                    for service_name, service_data in services.items()
+                )
             
             csv_files.append(filepath)
         
@@ -807,24 +1155,15 @@ class ReportGenerator:
         experiments = report_data.get('experiments', {})
         if experiments and 'experiment_history' in experiments:
             filename = f"experiments_report_{timestamp}.csv"
-            filepath = os.path.join(self.output_directory, filename)
+            filepath = self._output_path(filename)
             
             with open(filepath, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
-                writer.writerow(['Nombre', 'Tipo', 'Estado', 'Servicio_Target', 'Duración_s', 
-                               'Tiempo_Inicio', 'Tiempo_Fin', 'Mensaje_Error'])
-                
-                for experiment in experiments['experiment_history']:
-                    writer.writerow([
-                        experiment.get('name', ''),
-                        experiment.get('type', ''),
-                        experiment.get('status', ''),
-                        experiment.get('target_service', ''),
-                        experiment.get('runtime_seconds', 0),
-                        experiment.get('started_at', ''),
-                        experiment.get('completed_at', ''),
-                        experiment.get('error_message', '')
-                    ])
+                writer.writerow(_EXPERIMENTS_CSV_HEADER)
+                writer.writerows(
+                    [experiment.get(key, default) for key, default in _EXPERIMENTS_CSV_FIELDS]
+                    for experiment in experiments['experiment_history']
+                )
             
             csv_files.append(filepath)
         